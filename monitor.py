@@ -4,110 +4,345 @@
 Now supports CLI input for CIK, estimate, and tags. Examples:
 
   uv run monitor.py --cik 0000320193 --estimate 125000000000 --tags RevenueFromContractWithCustomerExcludingAssessedTax,SalesRevenueNet,Revenues
+  uv run monitor.py --ciks-file markets.json
+
+Several CIKs are checked concurrently in one process over a shared session.
 
 If no args are passed, you'll be prompted interactively.
 """
 
+import asyncio
+import random
 import time
 import signal
 import sys
 import argparse
+import json
+import re
+import traceback
+from typing import Any, Dict, Optional
+import requests
 from resolver import MarketResolver
+from resolvers.sec.config import (
+    DEFAULT_NET_INCOME_TAGS,
+    DEFAULT_REVENUE_TAGS,
+    MAX_POLL_INTERVAL_SEC,
+    POLL_INTERVAL_SEC,
+    SEC_MAX_CONCURRENCY,
+)
+from resolvers.sec.sec_client import create_session
 
 try:
-    from resolvers.sec.config import (  # type: ignore
-        POLL_INTERVAL_SEC,
-        DEFAULT_REVENUE_TAGS,
-        DEFAULT_NET_INCOME_TAGS,
-    )
-except ImportError:
-    from config import (  # type: ignore
-        POLL_INTERVAL_SEC,
-        DEFAULT_REVENUE_TAGS,
-        DEFAULT_NET_INCOME_TAGS,
-    )
-
-
-def signal_handler(sig, frame):
-    """Handle Ctrl+C gracefully."""
-    print("\n\nShutting down monitor...")
-    sys.exit(0)
+    import uvloop  # type: ignore
+except ImportError:  # pragma: no cover - falls back to the default asyncio loop
+    uvloop = None  # type: ignore
+
+
+_BAR = "=" * 60
+
+# Valid XBRL concept names; stray whitespace, quotes and separators are ignored
+_TAG_RE = re.compile(r"[A-Za-z][A-Za-z0-9_]*")
+
+# Consecutive ticks with unexpected (non-HTTP) errors before exiting so a
+# supervisor can restart the process
+MAX_CONSECUTIVE_FAILURES = 5
+
+PRESETS = {
+    "revenue": DEFAULT_REVENUE_TAGS,
+    "netincome": DEFAULT_NET_INCOME_TAGS,
+}
+
+
+def next_poll_interval(misses: int, max_interval: int) -> float:
+    """Double the poll interval per consecutive miss (capped), with ±10% jitter."""
+    interval = min(POLL_INTERVAL_SEC * (2 ** min(misses, 6)), max(max_interval, POLL_INTERVAL_SEC))
+    return interval * random.uniform(0.9, 1.1)
+
+
+def error_backoff(error: Exception, failures: int, max_interval: int) -> float:
+    """Seconds to wait after an HTTP failure.
+    
+    A 429 honours the server's Retry-After (default: four poll intervals);
+    other HTTP and connection errors back off exponentially per consecutive
+    failure, capped at ``max_interval``.
+    """
+    response = getattr(error, "response", None)
+    if response is not None and response.status_code == 429:
+        retry_after = response.headers.get("Retry-After", "")
+        return float(retry_after) if retry_after.isdigit() else POLL_INTERVAL_SEC * 4
+    return min(POLL_INTERVAL_SEC * (2 ** min(failures, 6)), max(max_interval, POLL_INTERVAL_SEC))
+
+
+def install_shutdown_handler(task: asyncio.Task) -> None:
+    """Cancel the monitor task on Ctrl+C so a pending sleep ends immediately."""
+    loop = asyncio.get_running_loop()
+    try:
+        loop.add_signal_handler(signal.SIGINT, task.cancel)
+    except NotImplementedError:  # e.g. Windows event loops; KeyboardInterrupt still applies
+        pass
 
 
 def parse_args():
     parser = argparse.ArgumentParser(description="SEC metric monitor")
-    parser.add_argument("--cik", help="Company CIK (10-digit, leading zeros)")
+    parser.add_argument("--cik", help="Company CIK (10-digit, leading zeros); comma-separated for several")
+    parser.add_argument("--ciks-file", help="JSON list of {cik, estimate, tags|preset} markets to monitor together")
     parser.add_argument("--estimate", type=float, help="Threshold estimate in USD")
     parser.add_argument("--tags", help="Comma-separated list of XBRL tags to try in order")
-    parser.add_argument("--preset", choices=["revenue", "netincome"], help="Use preset tags for revenue or net income")
+    parser.add_argument("--preset", choices=sorted(PRESETS), help="Use preset tags for revenue or net income")
+    parser.add_argument("--max-interval", type=int, default=MAX_POLL_INTERVAL_SEC, help="Cap in seconds for the backoff between polls with no new filings")
+    parser.add_argument("--quiet", action="store_true", help="Only print resolutions and errors, not routine poll lines")
     return parser.parse_args()
 
 
-def prompt_if_missing(value, prompt_text):
-    if value is None:
-        return input(prompt_text).strip()
-    return value
+def normalize_cik(value: Any) -> str:
+    """Return ``value`` as the 10-digit, zero-padded CIK used in SEC URLs.
+    
+    Raises:
+        ValueError: if ``value`` is not a CIK of at most 10 digits
+    """
+    cik = value.strip() if isinstance(value, str) else value
+    if isinstance(cik, bool) or not isinstance(cik, (int, str)):
+        raise ValueError(f"CIK must be a string or integer: {value!r}")
+    cik = str(cik)
+    if not cik.isdigit() or len(cik) > 10:
+        raise ValueError(f"CIK must be at most 10 digits: {value!r}")
+    return cik.zfill(10)
 
 
-def main():
-    """Main monitoring loop."""
-    args = parse_args()
+def load_markets_file(path: str) -> list[dict]:
+    """Load per-CIK market settings from a JSON file.
+    
+    The file holds a list of objects with ``cik`` (string or integer,
+    zero-padded to 10 digits), ``estimate`` and either ``tags`` (list,
+    priority order) or ``preset`` (revenue|netincome).
+    """
+    with open(path, encoding="utf-8") as f:
+        entries = json.load(f)
     
-    # Collect inputs (prompt if not provided)
-    cik = prompt_if_missing(args.cik, "Enter CIK (10 digits, e.g., 0000320193): ")
-    estimate_str = prompt_if_missing(str(args.estimate) if args.estimate is not None else None, "Enter estimate in USD (e.g., 125000000000): ")
+    if not isinstance(entries, list):
+        raise ValueError(f"{path} must hold a list of market entries")
     
-    # Determine tags from preset or manual input
-    if args.preset == "revenue":
-        tags = DEFAULT_REVENUE_TAGS
-    elif args.preset == "netincome":
-        tags = DEFAULT_NET_INCOME_TAGS
+    markets = []
+    for entry in entries:
+        if not isinstance(entry, dict):
+            raise ValueError(f"Market entry must be an object: {entry!r}")
+        preset = entry.get("preset", "")
+        if not isinstance(preset, str):
+            raise ValueError(f"Market entry preset must be one of {sorted(PRESETS)}: {entry}")
+        tags = entry.get("tags") or PRESETS.get(preset)
+        if "cik" not in entry or "estimate" not in entry or not tags:
+            raise ValueError(f"Market entry needs cik, estimate and tags or preset: {entry}")
+        # A bare string would otherwise be split into one-character tags
+        if not isinstance(tags, (list, tuple)) or not all(isinstance(t, str) for t in tags):
+            raise ValueError(f"Market entry tags must be a list of strings: {entry}")
+        try:
+            estimate = float(entry["estimate"])
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Market entry estimate must be a number (USD): {entry}") from e
+        markets.append({
+            "cik": normalize_cik(entry["cik"]),
+            "estimate": estimate,
+            "tags": tuple(sys.intern(t) for t in tags),
+        })
+    return markets
+
+
+def load_config(args: argparse.Namespace) -> Dict[str, Any]:
+    """Resolve CLI args into monitor settings, prompting only for missing values.
+    
+    Returns:
+        Dict with ``markets`` (list of cik/estimate/tags dicts), ``max_interval``
+        and ``quiet``
+        
+    Raises:
+        ValueError: if a CIK, the estimate, the tags or the markets file is
+            invalid, or nothing would be monitored
+    """
+    if args.ciks_file:
+        try:
+            markets = load_markets_file(args.ciks_file)
+        except OSError as e:
+            raise ValueError(f"could not read {args.ciks_file}: {e}") from e
     else:
-        tags_input = prompt_if_missing(args.tags, "Enter comma-separated XBRL tags (priority order): ")
-        tags = [t.strip() for t in tags_input.split(",") if t.strip()]
+        cik_input = args.cik or input("Enter CIK (10 digits, e.g., 0000320193): ")
+        ciks = [normalize_cik(c) for c in cik_input.split(",") if c.strip()]
+        if not ciks:
+            raise ValueError("at least one CIK is required")
+        
+        # argparse already parsed --estimate as a float; only prompted input needs parsing
+        if args.estimate is not None:
+            estimate = args.estimate
+        else:
+            try:
+                estimate = float(input("Enter estimate in USD (e.g., 125000000000): ").strip())
+            except ValueError as e:
+                raise ValueError("estimate must be a number (USD)") from e
+        
+        tags = PRESETS.get(args.preset) or tuple(
+            sys.intern(t)
+            for t in _TAG_RE.findall(args.tags or input("Enter comma-separated XBRL tags (priority order): "))
+        )
+        if not tags:
+            raise ValueError("at least one XBRL tag is required")
+        markets = [{"cik": cik, "estimate": estimate, "tags": tags} for cik in ciks]
     
+    if not markets:
+        raise ValueError("no markets to monitor")
+    return {"markets": markets, "max_interval": args.max_interval, "quiet": args.quiet}
+
+
+def main():
+    """Main monitoring loop."""
     try:
-        estimate = float(estimate_str)
-    except ValueError:
-        print("Estimate must be a number (USD). Exiting.")
+        config = load_config(parse_args())
+    except ValueError as e:
+        print(f"Invalid configuration: {e}. Exiting.")
         sys.exit(1)
+    markets = config["markets"]
     
-    print("="*60)
-    print("🚀 SEC Metric Monitor Started")
-    print("="*60)
-    print(f"CIK:              {cik}")
-    print(f"Estimate:         ${estimate:,.0f}")
-    print(f"Tags:             {', '.join(tags)}")
-    print(f"Poll Interval:    {POLL_INTERVAL_SEC}s ({POLL_INTERVAL_SEC//60} minutes)")
-    print(f"Target Forms:     10-Q, 10-K")
-    print("="*60)
-    print("\nMonitoring for new filings...\n")
+    lines = [_BAR, "🚀 SEC Metric Monitor Started", _BAR]
+    for market in markets:
+        lines += [
+            f"CIK:              {market['cik']}",
+            f"Estimate:         ${market['estimate']:,.0f}",
+            f"Tags:             {', '.join(market['tags'])}",
+        ]
+    lines += [
+        f"Poll Interval:    {POLL_INTERVAL_SEC}s ({POLL_INTERVAL_SEC//60} minutes)",
+        f"Max Interval:     {config['max_interval']}s (backoff while no new filings)",
+        "Target Forms:     10-Q, 10-K",
+        _BAR,
+        "\nMonitoring for new filings...\n",
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
     
-    # Set up signal handler for graceful shutdown
-    signal.signal(signal.SIGINT, signal_handler)
+    # All resolvers share one connection pool to data.sec.gov
+    session = create_session(pool_size=SEC_MAX_CONCURRENCY)
+    resolvers = [
+        MarketResolver(cik=m["cik"], tags=m["tags"], estimate=m["estimate"], session=session)
+        for m in markets
+    ]
     
-    resolver = MarketResolver(cik=cik, tags=tags, estimate=estimate)
+    try:
+        # uvloop's faster event loop when installed (perf extra, not on Windows)
+        run = uvloop.run if uvloop is not None else asyncio.run
+        run(monitor_loop(resolvers, max_interval=config["max_interval"], quiet=config["quiet"]))
+    except KeyboardInterrupt:
+        pass
+    print("\n\nShutting down monitor...")
+
+
+async def check_all(resolvers: list[MarketResolver]) -> tuple[bool, list[Exception]]:
+    """Check every resolver concurrently.
     
-    while True:
-        try:
-            timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
-            print(f"[{timestamp}] Checking for new filings...")
-            
-            resolution = resolver.check_for_resolution()
-            
-            if resolution:
-                resolver.print_resolution(resolution)
-                print("\n✅ Market resolved! Monitor will continue checking for new filings...")
-            else:
-                print("  → No new filings detected")
-            
-            print(f"  → Next check in {POLL_INTERVAL_SEC}s\n")
-            time.sleep(POLL_INTERVAL_SEC)
-            
-        except Exception as e:
-            print(f"❌ Error in monitoring loop: {e}")
-            print(f"  → Retrying in {POLL_INTERVAL_SEC}s\n")
-            time.sleep(POLL_INTERVAL_SEC)
+    Returns:
+        Whether any market resolved, and the exceptions raised by failed checks
+    """
+    semaphore = asyncio.Semaphore(SEC_MAX_CONCURRENCY)
+    
+    async def check(resolver: MarketResolver):
+        async with semaphore:
+            # The SEC client is blocking; run it off the loop so the sleep
+            # (and Ctrl+C) are never stuck behind an HTTP request.
+            return await asyncio.to_thread(resolver.check_for_resolution)
+    
+    results = await asyncio.gather(*(check(r) for r in resolvers), return_exceptions=True)
+    
+    resolved = False
+    errors: list[Exception] = []
+    for resolver, result in zip(resolvers, results):
+        if isinstance(result, Exception):
+            print(f"❌ Error checking CIK {resolver.client.cik}: {result}")
+            errors.append(result)
+        elif result:
+            resolved = True
+            # One market's report failing must not drop the others resolved this tick
+            try:
+                resolver.print_resolution(result)
+            except Exception as e:
+                print(f"❌ Error reporting resolution for CIK {resolver.client.cik}: {e}")
+                errors.append(e)
+    return resolved, errors
+
+
+async def monitor_loop(
+    resolvers: list[MarketResolver],
+    max_interval: int = MAX_POLL_INTERVAL_SEC,
+    quiet: bool = False,
+):
+    """Poll the resolvers forever, sleeping on the event loop between checks.
+    
+    The interval backs off exponentially while no new filings appear and
+    resets to POLL_INTERVAL_SEC after each resolution. With ``quiet`` only
+    resolutions and errors are printed.
+    """
+    def vprint(*args, **kwargs):
+        if not quiet:
+            print(*args, **kwargs)
+    
+    install_shutdown_handler(asyncio.current_task())
+    misses = 0
+    http_failures = 0
+    consecutive_failures = 0
+    
+    def record_failure(errors: list[Exception]) -> None:
+        """Print tracebacks for unexpected errors and exit after too many in a row."""
+        nonlocal consecutive_failures
+        consecutive_failures += 1
+        for error in errors:
+            traceback.print_exception(error)
+        if consecutive_failures >= MAX_CONSECUTIVE_FAILURES:
+            print(f"❌ {consecutive_failures} consecutive failed checks; exiting for a clean restart")
+            sys.exit(2)
+    
+    try:
+        while True:
+            try:
+                now = time.localtime()
+                timestamp = (
+                    f"{now.tm_year:04d}-{now.tm_mon:02d}-{now.tm_mday:02d} "
+                    f"{now.tm_hour:02d}:{now.tm_min:02d}:{now.tm_sec:02d}"
+                )
+                vprint(f"[{timestamp}] Checking for new filings...")
+                
+                resolved, errors = await check_all(resolvers)
+                http_errors = [e for e in errors if isinstance(e, requests.RequestException)]
+                unexpected = [e for e in errors if not isinstance(e, requests.RequestException)]
+                
+                if unexpected:
+                    record_failure(unexpected)
+                else:
+                    consecutive_failures = 0
+                
+                if resolved:
+                    print("\n✅ Market resolved! Monitor will continue checking for new filings...")
+                    misses = 0
+                else:
+                    misses += 1
+                
+                retry_delay: Optional[float] = None
+                if http_errors:
+                    http_failures += 1
+                    retry_delay = max(error_backoff(e, http_failures, max_interval) for e in http_errors)
+                else:
+                    http_failures = 0
+                
+                if retry_delay is not None:
+                    interval = retry_delay
+                    print(f"  → Backing off {interval:.0f}s after HTTP errors\n")
+                else:
+                    interval = next_poll_interval(misses, max_interval)
+                    status = [] if resolved else ["  → No new filings detected"]
+                    vprint("\n".join(status + [f"  → Next check in {interval:.0f}s\n"]))
+                await asyncio.sleep(interval)
+                
+            except Exception as e:
+                print(f"❌ Error in monitoring loop: {e}")
+                record_failure([e])
+                print(f"  → Retrying in {POLL_INTERVAL_SEC}s\n")
+                await asyncio.sleep(POLL_INTERVAL_SEC)
+    except asyncio.CancelledError:
+        return
 
 
 if __name__ == "__main__":
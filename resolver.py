@@ -1,25 +1,66 @@
 """Market resolution logic based on SEC data."""
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, NamedTuple, Sequence
 import json
-from datetime import datetime
+import sys
+import requests
+from datetime import datetime, timezone
 
-try:
-    from resolvers.sec.sec_client import SECClient  # type: ignore
-    from resolvers.sec.config import TARGET_FORMS  # type: ignore
-except ImportError:
-    from sec_client import SECClient  # type: ignore
-    from config import TARGET_FORMS  # type: ignore
+from resolvers.sec.config import RESOLUTION_LOG, TARGET_FORMS
+from resolvers.sec.sec_client import SECClient, create_session
+
+try:  # Optional fast JSON encoder for the resolution log
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - falls back to the stdlib encoder
+    orjson = None  # type: ignore
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize to compact JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(",", ":"), default=str)
+
+
+_BAR = "=" * 60
+_HEADER = "\n".join([_BAR, "🎯 MARKET RESOLVED", _BAR])
+
+# outcome -> (label, comparison shown between actual and estimate)
+_OUTCOME_GLYPHS = {
+    "YES": ("🟢 YES", ">"),
+    "NO": ("🔴 NO", "≤"),
+}
+
+
+class ResolutionSummary(NamedTuple):
+    """Minimal result of a resolved market; the full report is built on demand."""
+    
+    cik: str
+    accession: str
+    outcome: str
+    value: float
+    company: str
+    filing: Dict[str, Any]
+    metric: Dict[str, Any]
+    estimate: float
+    resolved_at: str
 
 
 class MarketResolver:
     """Resolves markets based on SEC filing data."""
     
-    def __init__(self, cik: str, tags: list[str], estimate: float):
-        self.client = SECClient(cik)
-        self.tags = tags
+    def __init__(self, cik: str, tags: Sequence[str], estimate: float, session: Optional[requests.Session] = None):
+        # A pooled session keeps the TLS connection to data.sec.gov warm
+        # between polls; pass one in to share it across resolvers.
+        self._session = session if session is not None else create_session()
+        # Let HTTP failures reach the monitor loop so it can back off per error type
+        self.client = SECClient(cik, session=self._session, raise_errors=True)
+        self.tags = tuple(tags)
         self.estimate = estimate
         self.last_checked_accession = None
+        # Scan of a still-unresolved accession as (accession, facts dict, metric
+        # or None); one slot, so no old companyfacts payload is kept alive
+        self._last_metric: Optional[tuple[str, Dict[str, Any], Optional[Dict[str, Any]]]] = None
 
     @staticmethod
     def _format_amount(value: float, currency: str) -> str:
@@ -35,11 +76,11 @@ class MarketResolver:
         suffix = currency_code.upper() if currency_code else ""
         return f"{value:,.0f}{(' ' + suffix) if suffix else ''}"
     
-    def check_for_resolution(self) -> Optional[Dict[str, Any]]:
+    def check_for_resolution(self) -> Optional[ResolutionSummary]:
         """Check if a new filing allows market resolution.
         
         Returns:
-            Resolution result dict if market can be resolved, None otherwise
+            Resolution summary if market can be resolved, None otherwise
         """
         # Get recent filings
         filings = self.client.get_recent_filings(TARGET_FORMS)
@@ -64,66 +105,112 @@ class MarketResolver:
             print("Could not fetch company facts")
             return None
         
-        # Extract latest revenue
-        metric_data = self.client.get_latest_metric(facts, self.tags)
+        # Extract latest metric; an unchanged facts payload (304 revalidation
+        # returns the same dict) reuses the previous scan
+        cached = self._last_metric
+        if cached and cached[0] == latest_filing["accession"] and cached[1] is facts:
+            metric_data = cached[2]
+        else:
+            metric_data = self.client.get_latest_metric(facts, self.tags)
+            self._last_metric = (latest_filing["accession"], facts, metric_data)
         if not metric_data:
             print("Could not extract requested metric from company facts")
             return None
         
-        # Resolve market
+        summary = self._compute_resolution(latest_filing, facts, metric_data)
+        
+        # Update last checked; the accession is never rescanned, so drop the slot
+        self.last_checked_accession = latest_filing["accession"]
+        self._last_metric = None
+        
+        return summary
+    
+    def _compute_resolution(
+        self,
+        filing: Dict[str, Any],
+        facts: Dict[str, Any],
+        metric_data: Dict[str, Any],
+    ) -> ResolutionSummary:
+        """Resolve the market against the estimate."""
         actual_value = float(metric_data["value"])
-        outcome = "YES" if actual_value > self.estimate else "NO"
+        return ResolutionSummary(
+            cik=self.client.cik,
+            accession=filing["accession"],
+            outcome="YES" if actual_value > self.estimate else "NO",
+            value=actual_value,
+            company=facts.get("entityName", "Unknown"),
+            filing=filing,
+            metric=metric_data,
+            estimate=self.estimate,
+            resolved_at=datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        )
+    
+    @staticmethod
+    def _format_resolution(summary: ResolutionSummary) -> Dict[str, Any]:
+        """Build the full resolution report used for display and the JSONL log."""
+        metric_data = summary.metric
         metric_currency = metric_data.get("currency", "usd").lower()
-        metric_formatted = self._format_amount(actual_value, metric_currency)
-        estimate_formatted = self._format_amount(self.estimate, metric_currency)
-        
-        resolution = {
-            "cik": self.client.cik,
-            "company": facts.get("entityName", "Unknown"),
+        return {
+            "cik": summary.cik,
+            "company": summary.company,
             "currency": metric_currency,
             "filing": {
-                "form": latest_filing["form"],
-                "accession": latest_filing["accession"],
-                "filing_date": latest_filing["filing_date"]
+                "form": summary.filing["form"],
+                "accession": summary.accession,
+                "filing_date": summary.filing["filing_date"]
             },
             "metric": {
                 "tag": metric_data["tag"],
-                "value": actual_value,
-                "formatted": metric_formatted,
+                "value": summary.value,
                 "currency": metric_currency,
                 "period_end": metric_data["end"],
                 "fiscal_year": metric_data["fiscal_year"],
                 "fiscal_period": metric_data["fiscal_period"]
             },
-            "estimate": self.estimate,
+            "estimate": summary.estimate,
             "estimate_currency": metric_currency,
-            "estimate_formatted": estimate_formatted,
-            "outcome": outcome,
-            "resolved_at": datetime.utcnow().isoformat()
+            "outcome": summary.outcome,
+            "resolved_at": summary.resolved_at
         }
-        
-        # Update last checked
-        self.last_checked_accession = latest_filing["accession"]
-        
-        return resolution
     
-    def print_resolution(self, resolution: Dict[str, Any]):
-        """Pretty print resolution result."""
-        print("\n" + "="*60)
-        print("🎯 MARKET RESOLVED")
-        print("="*60)
-        print(f"Company:      {resolution['company']}")
-        print(f"Filing:       {resolution['filing']['form']} ({resolution['filing']['filing_date']})")
-        print(f"Accession:    {resolution['filing']['accession']}")
-        print(f"\nMetric Tag:   {resolution['metric']['tag']}")
-        print(f"Period End:   {resolution['metric']['period_end']} ({resolution['metric']['fiscal_period']} {resolution['metric']['fiscal_year']})")
-        print(f"\nActual:       {resolution['metric']['formatted']}")
-        print(f"Estimate:     {resolution['estimate_formatted']}")
-        print(f"\n{'🟢 YES' if resolution['outcome'] == 'YES' else '🔴 NO'} - Actual {'>' if resolution['outcome'] == 'YES' else '≤'} Estimate")
-        print(f"\nOutcome:      {resolution['outcome']} POOL WINS")
-        print("="*60)
-        print(f"\nResolved at:  {resolution['resolved_at']}")
-        print("\nFull data:")
-        print(json.dumps(resolution, indent=2))
-        print("\n")
+    def print_resolution(self, summary: ResolutionSummary):
+        """Pretty print resolution result and append it to the log."""
+        resolution = self._format_resolution(summary)
+        metric = resolution["metric"]
+        filing = resolution["filing"]
+        glyph, op = _OUTCOME_GLYPHS[resolution["outcome"]]
+        # Summary first: a log that cannot be written must not hide the result
+        # Amounts are formatted only for display; the log keeps raw numbers
+        sys.stdout.write("\n".join([
+            "",
+            _HEADER,
+            f"Company:      {resolution['company']}",
+            f"Filing:       {filing['form']} ({filing['filing_date']})",
+            f"Accession:    {filing['accession']}",
+            f"\nMetric Tag:   {metric['tag']}",
+            f"Period End:   {metric['period_end']} ({metric['fiscal_period']} {metric['fiscal_year']})",
+            f"\nActual:       {self._format_amount(metric['value'], metric['currency'])}",
+            f"Estimate:     {self._format_amount(resolution['estimate'], resolution['estimate_currency'])}",
+            f"\n{glyph} - Actual {op} Estimate",
+            f"\nOutcome:      {resolution['outcome']} POOL WINS",
+            _BAR,
+            f"\nResolved at:  {resolution['resolved_at']}\n",
+        ]))
+        if self._append_to_log(resolution):
+            sys.stdout.write(f"Logged to:    {RESOLUTION_LOG}\n\n")
+    
+    @staticmethod
+    def _append_to_log(resolution: Dict[str, Any]) -> bool:
+        """Append the resolution as one compact JSON line to RESOLUTION_LOG.
+        
+        Returns:
+            False (after reporting the error) if the log could not be written
+        """
+        try:
+            with open(RESOLUTION_LOG, "a", encoding="utf-8") as f:
+                f.write(_dumps(resolution) + "\n")
+        except OSError as e:
+            print(f"⚠️  Could not append resolution to {RESOLUTION_LOG}: {e}\n")
+            return False
+        return True
 
@@ -0,0 +1 @@
+"""Data-source resolvers (SEC EDGAR, OpenDART)."""
@@ -0,0 +1,45 @@
+"""Pooled, retrying HTTP sessions shared by the SEC and OpenDART clients."""
+
+from typing import Mapping, Optional, Sequence
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+
+def build_session(
+    pool_connections: int,
+    pool_maxsize: int,
+    headers: Optional[Mapping[str, str]] = None,
+    schemes: Sequence[str] = ("https://",),
+) -> requests.Session:
+    """Build a keep-alive session with retries on throttling and server errors.
+
+    Args:
+        pool_connections: Number of per-host connection pools to cache
+        pool_maxsize: Connections kept warm per pool
+        headers: Extra default headers sent with every request
+        schemes: URL prefixes the pooled, retrying adapter is mounted for
+
+    Returns:
+        Session whose adapter retries 429/5xx responses with backoff
+    """
+    session = requests.Session()
+    retries = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        # Hand back the last error response so callers can read Retry-After
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=retries
+    )
+    for scheme in schemes:
+        session.mount(scheme, adapter)
+    # Negotiate every encoding urllib3 can decode here (br when brotli is installed)
+    session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+    if headers:
+        session.headers.update(headers)
+    return session
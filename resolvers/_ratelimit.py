@@ -0,0 +1,31 @@
+"""Process-wide request throttling shared by the SEC and OpenDART clients."""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """Thread-safe token bucket shared by every client in the process.
+
+    ``acquire`` reserves a token under the lock and sleeps off any deficit
+    outside it, so concurrent callers queue up without serializing on the lock.
+    """
+
+    def __init__(self, capacity: float, refill_rate: float) -> None:
+        self.capacity = max(1.0, float(capacity))
+        self.refill_rate = float(refill_rate)
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        if self.refill_rate <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.refill_rate)
+            self._last_refill = now
+            self._tokens -= 1
+            deficit = -self._tokens
+        if deficit > 0:
+            time.sleep(deficit / self.refill_rate)
@@ -1,6 +1,7 @@
 """Configuration for OpenDART client."""
 
 import os
+import sys
 from dotenv import load_dotenv
 
 
@@ -14,6 +15,24 @@ DART_API_KEY = os.getenv("DART_API_KEY") or os.getenv("OPEN_DART_API_KEY")
 # Simple rate limiting (OpenDART allows up to 10 requests per second, but we stay safe)
 DART_MIN_REQUEST_INTERVAL = float(os.getenv("DART_MIN_REQUEST_INTERVAL", "0.2"))
 
+# Token-bucket burst size: this many calls may go out back-to-back before
+# DART_MIN_REQUEST_INTERVAL spacing applies
+DART_BURST = int(os.getenv("DART_BURST", "4"))
+
+# Filing pages (report/viewer.do) come from the dart.fss.or.kr website, not
+# the API, so they are paced separately and sent with a browser User-Agent
+# (the same one OpenDartReader uses for that host)
+DART_VIEWER_MIN_REQUEST_INTERVAL = float(os.getenv("DART_VIEWER_MIN_REQUEST_INTERVAL", "0.5"))
+DART_VIEWER_USER_AGENT = (
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/105.0.3904.108 Safari/537.36"
+)
+
+
+# Directory for caches that persist across runs (e.g. ~/.cache/itchy).
+# Empty disables on-disk caching; lookups are still memoized in-process.
+DART_CACHE_DIR = os.path.expanduser(os.getenv("DART_CACHE_DIR", ""))
+
 
 # Default window for filings queries (OpenDART caps list results to 10,000 rows)
 DART_DEFAULT_LIST_DAYS = int(os.getenv("DART_DEFAULT_LIST_DAYS", "90"))
@@ -29,8 +48,8 @@ REPORT_CODE_LABELS = {
 
 
 # Columns returned from finstate that contain numeric amounts we care about
-AMOUNT_COLUMNS = (
+AMOUNT_COLUMNS = tuple(sys.intern(c) for c in (
     "thstrm_amount",  # current period
     "frmtrm_amount",  # previous period
     "bfefrmtrm_amount",  # two periods ago (annual only)
-)
+))
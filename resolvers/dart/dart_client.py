@@ -3,42 +3,105 @@
 from __future__ import annotations
 
 import datetime as _dt
+import functools
+import json
+import os
 import re
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
-try:
-    import OpenDartReader as _OpenDartReader  # type: ignore
-except ImportError as exc:  # pragma: no cover - dependency missing at runtime
-    raise RuntimeError(
-        "OpenDartReader package is required. Install it via pip or add to project dependencies."
-    ) from exc
+import requests
 
-# The PyPI distribution exposes the class directly when importing the module.
-# Access it via the module alias for clarity.
-OpenDartReader = _OpenDartReader  # type: ignore
+# OpenDartReader (and the pandas/lxml stack behind it) is imported on first
+# use so that importing this module stays cheap for callers that never
+# instantiate a client.
+_OPEN_DART_READER: Any = None
+_PANDAS: Any = None
+_PD_DATAFRAME: Any = None
+_PANDAS_LOADED = False
+
+
+def _get_open_dart_reader() -> Any:
+    """Return the OpenDartReader class, importing it on first call."""
+
+    global _OPEN_DART_READER
+    if _OPEN_DART_READER is None:
+        try:
+            import OpenDartReader as _OpenDartReader  # type: ignore
+        except ImportError as exc:  # pragma: no cover - dependency missing at runtime
+            raise RuntimeError(
+                "OpenDartReader package is required. Install it via pip or add to project dependencies."
+            ) from exc
+        # The PyPI distribution exposes the class directly when importing the module.
+        _OPEN_DART_READER = _OpenDartReader
+    return _OPEN_DART_READER
+
+
+# api_key -> OpenDartReader. Construction downloads and parses the
+# CORPCODE.xml corp-code table, so clients sharing a key share one reader.
+# OpenDartReader's read APIs keep no per-call state.
+_OPEN_DART_READERS: Dict[str, Any] = {}
+_OPEN_DART_READERS_LOCK = threading.Lock()
+
+
+def _get_shared_reader(api_key: str) -> Any:
+    """Return the process-wide OpenDartReader for ``api_key``, creating it once."""
+
+    with _OPEN_DART_READERS_LOCK:
+        reader = _OPEN_DART_READERS.get(api_key)
+        if reader is None:
+            reader = _OPEN_DART_READERS[api_key] = _get_open_dart_reader()(api_key)
+        return reader
+
+
+def _get_pd() -> Any:
+    """Return pandas, or None when unavailable, importing it on first call."""
+
+    global _PANDAS, _PD_DATAFRAME, _PANDAS_LOADED
+    if not _PANDAS_LOADED:
+        try:  # OpenDartReader depends on pandas, but be defensive
+            import pandas as pd  # type: ignore
+        except Exception:  # pragma: no cover - fallback when pandas is unavailable
+            pd = None  # type: ignore
+        _PANDAS = pd
+        # Cached so isinstance checks skip the attribute lookup
+        _PD_DATAFRAME = getattr(pd, "DataFrame", None) if pd is not None else None
+        _PANDAS_LOADED = True
+    return _PANDAS
 
-try:  # Optional pandas import (OpenDartReader depends on pandas, but be defensive)
-    import pandas as pd  # type: ignore
-except Exception:  # pragma: no cover - fallback when pandas is unavailable
-    pd = None  # type: ignore
 
 try:  # Support package-style imports as well as script execution
     from .config import (  # type: ignore[attr-defined]
         DART_API_KEY,
+        DART_BURST,
+        DART_CACHE_DIR,
         DART_DEFAULT_LIST_DAYS,
         DART_MIN_REQUEST_INTERVAL,
+        DART_VIEWER_MIN_REQUEST_INTERVAL,
+        DART_VIEWER_USER_AGENT,
         REPORT_CODE_LABELS,
         AMOUNT_COLUMNS,
     )
-except ImportError:
+    from .._http import build_session
+    from .._ratelimit import TokenBucket
+except ImportError:  # script execution; the repo root must be on sys.path
     from config import (  # type: ignore
         DART_API_KEY,
+        DART_BURST,
+        DART_CACHE_DIR,
         DART_DEFAULT_LIST_DAYS,
         DART_MIN_REQUEST_INTERVAL,
+        DART_VIEWER_MIN_REQUEST_INTERVAL,
+        DART_VIEWER_USER_AGENT,
         REPORT_CODE_LABELS,
         AMOUNT_COLUMNS,
     )
+    from resolvers._http import build_session
+    from resolvers._ratelimit import TokenBucket
 
 
 PERIOD_FISCAL_LABEL = {
@@ -55,6 +118,183 @@ PERIOD_FISCAL_LABEL = {
 
 PERIOD_FALLBACK_ORDER = ["half", "annual", "q3", "q1"]
 
+# Date strings such as 2024-06-30, 20240630 or 2024.06.30 (after normalization)
+_DATE_RE = re.compile(r"(\d{4})-?(\d{2})-?(\d{2})")
+
+# "2024-06-30" -> "20240630" for list.json date parameters
+_DATE_DIGITS = str.maketrans("", "", "-./")
+
+# "2024.06.30" / "2024/06/30" -> "2024-06-30" in a single pass
+_DATE_TRANS = str.maketrans({".": "-", "/": "-"})
+
+# Amount cells DART uses for "no value", and a table that drops thousands separators
+_BLANK_AMOUNTS = frozenset({"", "-", "NaN", "nan", "None", "null"})
+_COMMA_STRIP = str.maketrans("", "", ",")
+
+# Four-digit years inside report names, e.g. "반기보고서 (2024.06)"
+_YEAR_RE = re.compile(r"(20\d{2})")
+
+# period alias -> reprt_code used by the finstate API (read-only)
+_REPORT_CODE_MAP = MappingProxyType({
+    "annual": "11011",
+    "business": "11011",
+    "q4": "11011",
+    "half": "11012",
+    "semiannual": "11012",
+    "q2": "11012",
+    "q1": "11013",
+    "first": "11013",
+    "q3": "11014",
+    "third": "11014",
+})
+_REPORT_CODE_KEYS = tuple(sorted(_REPORT_CODE_MAP))
+
+# Report-name keyword -> period, in priority order (read-only)
+_PERIOD_KEYWORDS = MappingProxyType({
+    "반기": "half",
+    "semi": "half",
+    "사업": "annual",
+    "연간": "annual",
+    "1분기": "q1",
+    "1q": "q1",
+    "3분기": "q3",
+    "3q": "q3",
+})
+_PERIOD_PRIORITY = {keyword: rank for rank, keyword in enumerate(_PERIOD_KEYWORDS)}
+# Single case-insensitive alternation so a report name is scanned once for
+# all keywords without lower-casing the whole (mostly Hangul) string first
+_PERIOD_RE = re.compile(
+    "|".join(re.escape(keyword) for keyword in _PERIOD_KEYWORDS), re.IGNORECASE
+)
+
+# OpenDART REST endpoints called directly (JSON in, plain records out)
+_DART_API_BASE = "https://opendart.fss.or.kr/api/"
+_DART_STATUS_OK = "000"
+_DART_STATUS_NO_DATA = "013"
+_DART_TIMEOUT_SEC = 30
+_DART_LIST_PAGE_SIZE = 100
+
+# Entries kept per in-process response cache (least recently used evicted)
+_CACHE_MAX_ENTRIES = 256
+
+# Reporting contexts come from the live filings list; refresh them this often
+_CONTEXT_TTL_SEC = 300
+
+# Company overviews and filed statements rarely change; reuse them this long
+_RESPONSE_TTL_SEC = 24 * 3600
+
+# How long a cached date.today() is trusted before it is read again
+_TODAY_TTL_SEC = 60
+
+
+def create_session(pool_connections: int = 8, pool_maxsize: int = 16) -> requests.Session:
+    """Build a keep-alive session for opendart.fss.or.kr with retries.
+
+    Args:
+        pool_connections: Number of per-host connection pools to cache
+        pool_maxsize: Connections kept warm per pool (bounds parallel probes)
+
+    Returns:
+        Session that can be shared between OpenDartClient instances
+    """
+    # http:// too: sub_docs hands back http://dart.fss.or.kr viewer URLs
+    return build_session(pool_connections, pool_maxsize, schemes=("https://", "http://"))
+
+
+# query (name or code) -> corp_code, shared by every client in the process and
+# mirrored to DART_CACHE_DIR/corp_codes.json when a cache directory is set
+_CORP_CODES: Dict[str, str] = {}
+_CORP_CODES_LOCK = threading.Lock()
+_CORP_CODES_LOADED = False
+
+
+def _corp_codes_path() -> Optional[str]:
+    return os.path.join(DART_CACHE_DIR, "corp_codes.json") if DART_CACHE_DIR else None
+
+
+def _lookup_corp_code(query: str) -> Optional[str]:
+    """Return a remembered corp_code, loading the on-disk cache on first use."""
+
+    global _CORP_CODES_LOADED
+    with _CORP_CODES_LOCK:
+        if not _CORP_CODES_LOADED:
+            _CORP_CODES_LOADED = True
+            path = _corp_codes_path()
+            if path and os.path.exists(path):
+                try:
+                    with open(path, "r", encoding="utf-8") as handle:
+                        stored = json.load(handle)
+                    if isinstance(stored, dict):
+                        _CORP_CODES.update({str(k): str(v) for k, v in stored.items()})
+                except (OSError, ValueError):
+                    pass  # a corrupt cache only costs a lookup
+        return _CORP_CODES.get(query)
+
+
+def _remember_corp_code(query: str, code: str) -> None:
+    with _CORP_CODES_LOCK:
+        _CORP_CODES[query] = code
+        path = _corp_codes_path()
+        if not path:
+            return
+        try:
+            os.makedirs(DART_CACHE_DIR, exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as handle:
+                json.dump(_CORP_CODES, handle, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass  # persistence is best-effort
+
+
+# One bucket for all clients: OpenDART's quota is per API key, not per client.
+# Up to DART_BURST calls go out back-to-back, then one per
+# DART_MIN_REQUEST_INTERVAL seconds.
+_DART_BUCKET = TokenBucket(
+    DART_BURST,
+    1.0 / DART_MIN_REQUEST_INTERVAL if DART_MIN_REQUEST_INTERVAL > 0 else 0.0,
+)
+
+# Filing pages are served by the DART website, outside the API quota; they
+# get their own evenly spaced bucket so downloads never starve API calls
+_DART_VIEWER_BUCKET = TokenBucket(
+    1,
+    1.0 / DART_VIEWER_MIN_REQUEST_INTERVAL if DART_VIEWER_MIN_REQUEST_INTERVAL > 0 else 0.0,
+)
+
+
+def _fmt_date(value: _dt.date) -> str:
+    """Format as YYYY-MM-DD without going through strftime."""
+
+    return f"{value.year:04d}-{value.month:02d}-{value.day:02d}"
+
+
+def _ttl_cached(ttl: float) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Memoize an OpenDartClient method per call arguments for ``ttl`` seconds.
+
+    The wrapped method gains a ``refresh`` keyword that bypasses the cached
+    value and stores the fresh one.
+    """
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(func)
+        def wrapper(self: "OpenDartClient", *args: Any, refresh: bool = False, **kwargs: Any) -> Any:
+            # The client's default corp_code is part of the key because
+            # ``corp_code=None`` resolves to it
+            key = (func.__name__, self.corp_code, args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+            if not refresh:
+                hit = self._cache_get(self._ttl_cache, key)
+                if hit is not None and hit[0] > now:
+                    return hit[1]
+            value = func(self, *args, **kwargs)
+            self._cache_put(self._ttl_cache, key, (now + ttl, value))
+            return value
+
+        return wrapper
+
+    return decorator
+
 
 class OpenDartError(RuntimeError):
     """Domain-specific error raised for OpenDART client failures."""
@@ -78,6 +318,7 @@ class OpenDartClient:
         corp_code: Optional[str] = None,
         corp_name: Optional[str] = None,
         auto_find: bool = True,
+        session: Optional[requests.Session] = None,
     ) -> None:
         """Create an OpenDART client.
 
@@ -87,6 +328,7 @@ class OpenDartClient:
             corp_name: Korean company name (full or partial)
             auto_find: When ``corp_name`` is provided but ``corp_code`` is not,
                 automatically resolve the code via ``find_corp_code``.
+            session: Optional shared HTTP session (defaults to ``create_session()``)
 
         Raises:
             OpenDartError: if no API key is configured.
@@ -99,9 +341,22 @@ class OpenDartClient:
                 "or pass api_key explicitly."
             )
 
-        self._dart = OpenDartReader(self.api_key)
-        self._last_request_ts = 0.0
-        self._min_interval = max(DART_MIN_REQUEST_INTERVAL, 0.0)
+        self._dart = _get_shared_reader(self.api_key)
+        # Pooled keep-alive session for endpoints we call directly instead of
+        # going through OpenDartReader's DataFrame construction
+        self._session = session if session is not None else create_session()
+        self._rate_bucket = _DART_BUCKET
+
+        # In-process memoization of deterministic lookups
+        self._cache_lock = threading.Lock()
+        # Values are (expires_at, records, lowered account_nm -> first row index)
+        self._finstate_cache: "OrderedDict[Tuple[str, int, str], Tuple[float, List[Dict[str, Any]], Dict[str, int]]]" = OrderedDict()
+        # Values are (expires_at, result) for @_ttl_cached methods
+        self._ttl_cache: "OrderedDict[Tuple[Any, ...], Tuple[float, Any]]" = OrderedDict()
+        self._context_cache: "OrderedDict[Tuple[Any, ...], List[Tuple[Optional[int], Optional[str], Optional[Dict[str, Any]]]]]" = OrderedDict()
+
+        # (monotonic timestamp, date) of the last date.today() read
+        self._today: Optional[Tuple[float, _dt.date]] = None
 
         self.corp_code: Optional[str] = None
         if corp_code:
@@ -120,12 +375,21 @@ class OpenDartClient:
         return code
 
     def _rate_limit(self) -> None:
-        if self._min_interval <= 0:
-            return
-        elapsed = time.time() - self._last_request_ts
-        if elapsed < self._min_interval:
-            time.sleep(self._min_interval - elapsed)
-        self._last_request_ts = time.time()
+        self._rate_bucket.acquire()
+
+    def _cache_get(self, cache: "OrderedDict[Any, Any]", key: Any) -> Any:
+        with self._cache_lock:
+            value = cache.get(key)
+            if value is not None:
+                cache.move_to_end(key)
+            return value
+
+    def _cache_put(self, cache: "OrderedDict[Any, Any]", key: Any, value: Any) -> None:
+        with self._cache_lock:
+            cache[key] = value
+            cache.move_to_end(key)
+            while len(cache) > _CACHE_MAX_ENTRIES:
+                cache.popitem(last=False)
 
     def _call(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
         self._rate_limit()
@@ -134,6 +398,39 @@ class OpenDartClient:
         except Exception as exc:  # pragma: no cover - third-party errors wrapped
             raise OpenDartError(str(exc)) from exc
 
+    def _api_get(self, endpoint: str, **params: Any) -> Optional[Dict[str, Any]]:
+        """GET ``<endpoint>.json`` and return the decoded payload.
+
+        Returns None when OpenDART reports no data (status 013); any other
+        non-success status raises OpenDartError.
+        """
+        params["crtfc_key"] = self.api_key
+        self._rate_limit()
+        try:
+            resp = self._session.get(
+                f"{_DART_API_BASE}{endpoint}.json", params=params, timeout=_DART_TIMEOUT_SEC
+            )
+            resp.raise_for_status()
+            payload = resp.json()
+        except (requests.RequestException, ValueError) as exc:
+            raise OpenDartError(f"OpenDART {endpoint} request failed: {exc}") from exc
+
+        status = payload.get("status")
+        if status == _DART_STATUS_NO_DATA:
+            return None
+        if status != _DART_STATUS_OK:
+            raise OpenDartError(
+                f"OpenDART {endpoint} returned status {status}: {payload.get('message', '')}"
+            )
+        return payload
+
+    def _get_today(self) -> _dt.date:
+        now = time.monotonic()
+        cached = self._today
+        if cached is None or now - cached[0] > _TODAY_TTL_SEC:
+            cached = self._today = (now, _dt.date.today())
+        return cached[1]
+
     def _ensure_corp_code(self, corp_code: Optional[str] = None) -> str:
         code = corp_code or self.corp_code
         if not code:
@@ -143,28 +440,44 @@ class OpenDartClient:
             )
         return self._normalize_corp_code(code)
 
+    def _api_corp_code(self, corp_code: Optional[str] = None) -> str:
+        """Return the 8-digit corp_code the REST endpoints require.
+
+        OpenDartReader accepts stock codes and names too; those are mapped
+        through the shared reader's corp-code table (cached).
+        """
+        code = self._ensure_corp_code(corp_code)
+        if len(code) == 8 and code.isdigit():
+            return code
+        return self.find_corp_code(code)
+
     def _to_records(self, frame: Any) -> List[Dict[str, Any]]:
+        # Cheap checks first: plain JSON-style payloads never touch pandas
         if frame is None:
             return []
-        if pd is not None:
-            dataframe_cls = getattr(pd, "DataFrame", None)
-            if dataframe_cls is not None and isinstance(frame, dataframe_cls):
-                if frame.empty:
-                    return []
-                na_sentinel = getattr(pd, "NA", None)
-                if na_sentinel is not None:
-                    frame = frame.replace({na_sentinel: None})
-                frame = frame.where(pd.notnull(frame), None)
-                return frame.to_dict(orient="records")
+        if isinstance(frame, list):
+            return frame
+        if isinstance(frame, dict):
+            return [frame]
+        pd = _get_pd()
+        if pd is not None and isinstance(frame, _PD_DATAFRAME):
+            if frame.empty:
+                return []
+            # One object-dtype pass maps NaN/NaT/pd.NA to None and yields
+            # Python scalars; no intermediate DataFrames are allocated
+            columns = frame.columns.tolist()
+            is_extension = pd.api.types.is_extension_array_dtype
+            if all(dtype.kind in "iub" and not is_extension(dtype) for dtype in frame.dtypes):
+                # Plain numpy int/bool columns cannot hold nulls; skip the NA scan
+                values = frame.to_numpy(dtype=object)
+            else:
+                values = frame.to_numpy(dtype=object, na_value=None)
+            return [dict(zip(columns, row)) for row in values.tolist()]
         if hasattr(frame, "to_dict"):
             try:
                 return list(frame.to_dict("records"))  # type: ignore[call-arg]
             except Exception:  # pragma: no cover - fallback path
                 pass
-        if isinstance(frame, dict):
-            return [frame]
-        if isinstance(frame, list):
-            return frame
         raise OpenDartError("Unexpected response type from OpenDartReader")
 
     # ------------------------------------------------------------------
@@ -175,21 +488,29 @@ class OpenDartClient:
 
         if not query:
             raise OpenDartError("Query cannot be empty when searching corp code")
+        cached = _lookup_corp_code(query)
+        if cached:
+            return cached
         # OpenDartReader already accepts either code or name; simply pass through
         code = self._call(self._dart.find_corp_code, query)
         if not code:
             raise OpenDartError(f"No corporation found for query '{query}'")
-        return self._normalize_corp_code(code)
+        code = self._normalize_corp_code(code)
+        _remember_corp_code(query, code)
+        return code
 
+    @_ttl_cached(_RESPONSE_TTL_SEC)
     def get_company(self, corp_code: Optional[str] = None) -> Dict[str, Any]:
-        """Fetch company overview (기업개황)."""
+        """Fetch company overview (기업개황).
 
-        code = self._ensure_corp_code(corp_code)
-        frame = self._call(self._dart.company, code)
-        records = self._to_records(frame)
-        if not records:
+        Results are reused for up to a day; pass ``refresh=True`` to refetch.
+        """
+
+        code = self._api_corp_code(corp_code)
+        payload = self._api_get("company", corp_code=code)
+        if not payload:
             raise OpenDartError(f"No company overview returned for corp_code {code}")
-        return records[0]
+        return {key: value for key, value in payload.items() if key not in ("status", "message")}
 
     def search_companies(self, name: str) -> List[Dict[str, Any]]:
         """Search companies whose names contain the given keyword."""
@@ -222,23 +543,35 @@ class OpenDartClient:
             limit: optional manual cap on the number of rows returned
         """
 
-        code = self._ensure_corp_code(corp_code)
+        code = self._api_corp_code(corp_code)
 
         start_str = self._coerce_date_str(start, days_back=DART_DEFAULT_LIST_DAYS)
         end_str = self._coerce_date_str(end, default_today=True)
 
-        kwargs: Dict[str, Any] = {
-            "corp": code,
-            "start": start_str,
-            "end": end_str,
+        # list.json wants YYYYMMDD and pages at most 100 rows at a time;
+        # results come back newest first, so paging stops once limit is met
+        params: Dict[str, Any] = {
+            "corp_code": code,
+            "bgn_de": start_str.translate(_DATE_DIGITS),
+            "end_de": end_str.translate(_DATE_DIGITS),
+            "last_reprt_at": "N" if final is False else "Y",
+            "page_count": min(_DART_LIST_PAGE_SIZE, limit) if limit else _DART_LIST_PAGE_SIZE,
         }
         if kind:
-            kwargs["kind"] = kind
-        if final is not None:
-            kwargs["final"] = final
+            params["pblntf_ty"] = kind
 
-        frame = self._call(self._dart.list, **kwargs)
-        records = self._to_records(frame)
+        records: List[Dict[str, Any]] = []
+        page_no = 1
+        while True:
+            payload = self._api_get("list", page_no=page_no, **params)
+            if not payload:
+                break
+            records.extend(payload.get("list") or [])
+            if limit is not None and len(records) >= limit:
+                break
+            if page_no >= int(payload.get("total_page") or 1):
+                break
+            page_no += 1
 
         if limit is not None:
             return records[:limit]
@@ -256,10 +589,20 @@ class OpenDartClient:
         forms = list(forms) if forms else []
 
         records: List[Dict[str, Any]] = []
-        if forms:
-            for form in forms:
-                subset = self.list_filings(corp_code=code, kind=form, limit=limit)
-                records.extend(subset)
+        if len(forms) > 1:
+            # One list query per kind, issued concurrently (the token bucket
+            # still paces them); merged newest first since kinds interleave
+            with ThreadPoolExecutor(max_workers=min(len(forms), 8)) as executor:
+                for subset in executor.map(
+                    lambda form: self.list_filings(corp_code=code, kind=form, limit=limit), forms
+                ):
+                    records.extend(subset)
+            records.sort(
+                key=lambda rec: (str(rec.get("rcept_dt") or ""), str(rec.get("rcept_no") or "")),
+                reverse=True,
+            )
+        elif forms:
+            records = self.list_filings(corp_code=code, kind=forms[0], limit=limit)
         else:
             records = self.list_filings(corp_code=code, limit=limit)
 
@@ -278,6 +621,55 @@ class OpenDartClient:
             )
         return results
 
+    def get_document_list(self, rcept_no: str, match: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Return the sub-documents (``title``, ``url``) of a filing.
+
+        Args:
+            rcept_no: Receipt number of the filing (접수번호)
+            match: Optional title to sort the list by similarity
+        """
+
+        if not rcept_no:
+            raise OpenDartError("rcept_no cannot be empty")
+        frame = self._call(self._dart.sub_docs, str(rcept_no), match=match)
+        return self._to_records(frame)
+
+    def get_documents(
+        self,
+        rcept_no: str,
+        match: Optional[str] = None,
+        max_workers: int = 4,
+    ) -> List[Dict[str, Any]]:
+        """Fetch every sub-document of a filing, downloading pages concurrently.
+
+        Each entry from ``get_document_list`` gains an ``html`` key. Downloads
+        share the client's session but are paced by the website's own limiter,
+        not the API bucket; order is preserved.
+        """
+
+        docs = self.get_document_list(rcept_no, match=match)
+        if not docs:
+            return []
+
+        def fetch(doc: Dict[str, Any]) -> Dict[str, Any]:
+            _DART_VIEWER_BUCKET.acquire()
+            try:
+                resp = self._session.get(
+                    doc["url"],
+                    headers={"User-Agent": DART_VIEWER_USER_AGENT},
+                    timeout=_DART_TIMEOUT_SEC,
+                )
+                resp.raise_for_status()
+            except requests.RequestException as exc:
+                raise OpenDartError(f"Failed to fetch document {doc.get('title')}: {exc}") from exc
+            return {**doc, "html": resp.text}
+
+        workers = max(1, min(max_workers, len(docs)))
+        if workers == 1:
+            return [fetch(doc) for doc in docs]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(fetch, docs))
+
     # ------------------------------------------------------------------
     # Financial statements helpers
     # ------------------------------------------------------------------
@@ -287,23 +679,62 @@ class OpenDartClient:
         period: str = "annual",
         corp_code: Optional[str] = None,
         consolidated: bool = True,
+        reprt_code: Optional[str] = None,
+        refresh: bool = False,
     ) -> List[Dict[str, Any]]:
         """Fetch financial statement rows for a given year/period.
 
+        Non-empty results are reused for up to a day.
+
         Args:
             year: Fiscal year (e.g., 2023)
             period: One of ``annual``, ``q1``, ``half``, ``q3``
             corp_code: override corporation
             consolidated: Use consolidated financial statements (CFS) or separate (OFS)
+            reprt_code: Already-resolved report code; skips resolving ``period``
+            refresh: Ignore any cached rows and refetch
         """
 
-        code = self._ensure_corp_code(corp_code)
-        reprt_code = self._resolve_report_code(period)
-        # OpenDartReader currently exposes only consolidated statements via finstate.
-        # Separate financials require a different endpoint; for now we ignore the flag.
+        if reprt_code is None:
+            reprt_code = self._resolve_report_code(period)
+        return self._load_financial_statements(year, reprt_code, corp_code, refresh)[0]
 
-        frame = self._call(self._dart.finstate, code, year, reprt_code=reprt_code)
-        return self._to_records(frame)
+    def _load_financial_statements(
+        self,
+        year: int,
+        reprt_code: str,
+        corp_code: Optional[str],
+        refresh: bool = False,
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+        """Return finstate rows plus an account-name index, cached together."""
+
+        code = self._api_corp_code(corp_code)
+        # fnlttSinglAcnt returns consolidated and separate rows together
+        # (see ``fs_div``); for now we ignore the flag.
+
+        cache_key = (code, year, reprt_code)
+        now = time.monotonic()
+        if not refresh:
+            cached = self._cache_get(self._finstate_cache, cache_key)
+            if cached is not None and cached[0] > now:
+                return cached[1], cached[2]
+
+        # Rows come back as plain dicts; amount strings are parsed later by
+        # _parse_amount, so no DataFrame is built on this path
+        payload = self._api_get(
+            "fnlttSinglAcnt", corp_code=code, bsns_year=str(year), reprt_code=reprt_code
+        )
+        records = self._to_records(payload.get("list") if payload else None)
+        account_index: Dict[str, int] = {}
+        for idx, row in enumerate(records):
+            key = str(row.get("account_nm") or "").lower()
+            if key:
+                account_index.setdefault(key, idx)
+        if records:  # an empty result may just mean "not filed yet"
+            self._cache_put(
+                self._finstate_cache, cache_key, (now + _RESPONSE_TTL_SEC, records, account_index)
+            )
+        return records, account_index
 
     def get_financial_metric(
         self,
@@ -322,23 +753,19 @@ class OpenDartClient:
         if not account_names:
             raise OpenDartError("account_names must contain at least one entry")
 
-        statements = self.get_financial_statements(
-            year=year,
-            period=period,
-            corp_code=corp_code,
-            consolidated=consolidated,
-        )
+        reprt_code = self._resolve_report_code(period)
+        statements, account_index = self._load_financial_statements(year, reprt_code, corp_code)
 
         if not statements:
             return None
 
-        lowered = [name.lower() for name in account_names]
-
-        for row in statements:
-            account_nm = str(row.get("account_nm", ""))
-            if account_nm.lower() in lowered:
-                return self._build_metric_response(row, year, period, consolidated)
-
+        # Account names are tried in priority order, as documented
+        for name in account_names:
+            idx = account_index.get(name.lower())
+            if idx is not None:
+                return self._build_metric_response(
+                    statements[idx], year, period, consolidated, reprt_code
+                )
         return None
 
     def _build_metric_response(
@@ -347,8 +774,8 @@ class OpenDartClient:
         year: int,
         period: str,
         consolidated: bool,
+        reprt_code: str,
     ) -> Dict[str, Any]:
-        reprt_code = self._resolve_report_code(period)
         parsed_amounts = {
             key: self._parse_amount(row.get(key))
             for key in AMOUNT_COLUMNS
@@ -394,23 +821,47 @@ class OpenDartClient:
         code = self._ensure_corp_code(corp_code)
         contexts = self._collect_reporting_contexts(code, year, period)
 
-        seen: set[tuple[int, str]] = set()
-        for ctx_year, ctx_period, filing in contexts:
-            if ctx_year is None or ctx_period is None:
-                continue
-            key = (ctx_year, ctx_period)
-            if key in seen:
-                continue
-            seen.add(key)
+        # Contexts are already unique per (year, period); drop incomplete ones
+        candidates = [
+            (ctx_year, ctx_period, filing)
+            for ctx_year, ctx_period, filing in contexts
+            if ctx_year is not None and ctx_period is not None
+        ]
+
+        if not candidates:
+            return None
 
-            metric = self.get_financial_metric(
+        def fetch(ctx_year: int, ctx_period: str) -> Optional[Dict[str, Any]]:
+            return self.get_financial_metric(
                 account_names,
                 year=ctx_year,
                 period=ctx_period,
                 corp_code=code,
             )
-            if metric and metric.get("current_amount") is not None:
-                return self._build_latest_metric_payload(metric, filing)
+
+        max_workers = min(8, len(candidates), int(self._rate_bucket.capacity))
+        if max_workers <= 1:
+            for ctx_year, ctx_period, filing in candidates:
+                metric = fetch(ctx_year, ctx_period)
+                if metric and metric.get("current_amount") is not None:
+                    return self._build_latest_metric_payload(metric, filing)
+            return None
+
+        # Probe every candidate concurrently (the token bucket still paces the
+        # calls), then take the first hit in priority order.
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                (executor.submit(fetch, ctx_year, ctx_period), filing)
+                for ctx_year, ctx_period, filing in candidates
+            ]
+            try:
+                for future, filing in futures:
+                    metric = future.result()
+                    if metric and metric.get("current_amount") is not None:
+                        return self._build_latest_metric_payload(metric, filing)
+            finally:
+                for future, _ in futures:
+                    future.cancel()
 
         return None
 
@@ -419,19 +870,24 @@ class OpenDartClient:
         metric: Dict[str, Any],
         filing: Optional[Dict[str, Any]],
     ) -> Dict[str, Any]:
-        report = metric.get("report", {})
-        raw = metric.get("raw", {})
-        period_key = str(report.get("period", "")).lower()
-        fiscal_label = PERIOD_FISCAL_LABEL.get(period_key, period_key.upper())
-        end_date = self._extract_period_end(metric.get("current_date"))
-        accession = raw.get("rcept_no") or (filing.get("rcept_no") if filing else None)
-        filed = filing.get("rcept_dt") if filing else None
+        metric_get = metric.get
+        report = metric_get("report") or {}
+        raw = metric_get("raw") or {}
+        period_str = report.get("period")
+        period_key = str(period_str).lower() if period_str else ""
+        fiscal_label = PERIOD_FISCAL_LABEL.get(period_key) or period_key.upper()
+        if filing:
+            accession = raw.get("rcept_no") or filing.get("rcept_no")
+            filed = filing.get("rcept_dt")
+        else:
+            accession = raw.get("rcept_no")
+            filed = None
 
         return {
-            "tag": metric.get("account_name"),
-            "value": metric.get("current_amount"),
-            "end": end_date,
-            "currency": metric.get("currency", "krw"),
+            "tag": metric_get("account_name"),
+            "value": metric_get("current_amount"),
+            "end": self._extract_period_end(metric_get("current_date")),
+            "currency": metric_get("currency", "krw"),
             "accession": accession,
             "form": report.get("reprt_name", ""),
             "filed": filed,
@@ -444,6 +900,21 @@ class OpenDartClient:
         corp_code: str,
         explicit_year: Optional[int],
         explicit_period: Optional[str],
+    ) -> List[Tuple[Optional[int], Optional[str], Optional[Dict[str, Any]]]]:
+        # Bucketing monotonic time keeps cached contexts at most _CONTEXT_TTL_SEC old
+        cache_key = (int(time.monotonic() // _CONTEXT_TTL_SEC), corp_code, explicit_year, explicit_period)
+        cached = self._cache_get(self._context_cache, cache_key)
+        if cached is not None:
+            return cached
+        contexts = self._build_reporting_contexts(corp_code, explicit_year, explicit_period)
+        self._cache_put(self._context_cache, cache_key, contexts)
+        return contexts
+
+    def _build_reporting_contexts(
+        self,
+        corp_code: str,
+        explicit_year: Optional[int],
+        explicit_period: Optional[str],
     ) -> List[Tuple[Optional[int], Optional[str], Optional[Dict[str, Any]]]]:
         ordered: List[Tuple[Optional[int], Optional[str], Optional[Dict[str, Any]]]] = []
 
@@ -455,7 +926,7 @@ class OpenDartClient:
                 for period_key in PERIOD_FALLBACK_ORDER:
                     ordered.append((explicit_year, period_key, None))
             if explicit_period is not None:
-                current_year = _dt.date.today().year
+                current_year = self._get_today().year
                 for year_candidate in (current_year, current_year - 1):
                     ordered.append((year_candidate, explicit_period, None))
 
@@ -469,22 +940,17 @@ class OpenDartClient:
 
         # 3) Fallback combos if nothing usable so far
         if not ordered:
-            current_year = _dt.date.today().year
+            current_year = self._get_today().year
             for year_candidate in (current_year, current_year - 1):
                 for period_key in PERIOD_FALLBACK_ORDER:
                     ordered.append((year_candidate, period_key, None))
 
-        # Deduplicate while preserving priority
-        deduped: List[Tuple[Optional[int], Optional[str], Optional[Dict[str, Any]]]] = []
-        seen: set[Tuple[Optional[int], Optional[str]]] = set()
+        # Deduplicate while preserving priority (insertion-ordered dict, first wins)
+        deduped: Dict[Tuple[Optional[int], Optional[str]], Optional[Dict[str, Any]]] = {}
         for year, period, filing in ordered:
-            key = (year, period)
-            if key in seen:
-                continue
-            seen.add(key)
-            deduped.append((year, period, filing))
+            deduped.setdefault((year, period), filing)
 
-        return deduped
+        return [(year, period, filing) for (year, period), filing in deduped.items()]
 
     def _extract_period_end(self, period_text: Optional[str]) -> Optional[str]:
         if not period_text:
@@ -500,8 +966,8 @@ class OpenDartClient:
     def _normalize_date_string(self, text: Optional[str]) -> str:
         if text is None:
             return ""
-        cleaned = str(text).strip().replace(".", "-").replace("/", "-")
-        match = re.match(r"(\d{4})-?(\d{2})-?(\d{2})", cleaned)
+        cleaned = str(text).strip().translate(_DATE_TRANS)
+        match = _DATE_RE.match(cleaned)
         if match:
             return f"{match.group(1)}-{match.group(2)}-{match.group(3)}"
         return cleaned
@@ -522,7 +988,7 @@ class OpenDartClient:
     def _extract_year_from_report(self, report_nm: str) -> Optional[int]:
         if not report_nm:
             return None
-        match = re.search(r"(20\d{2})", report_nm)
+        match = _YEAR_RE.search(report_nm)
         if match:
             return int(match.group(1))
         return None
@@ -530,21 +996,13 @@ class OpenDartClient:
     def _infer_period_from_report(self, report_nm: str) -> Optional[str]:
         if not report_nm:
             return None
-        lower = report_nm.lower()
-        mappings = {
-            "반기": "half",
-            "semi": "half",
-            "사업": "annual",
-            "연간": "annual",
-            "1분기": "q1",
-            "1q": "q1",
-            "3분기": "q3",
-            "3q": "q3",
-        }
-        for keyword, period in mappings.items():
-            if keyword in lower:
-                return period
-        return None
+        hits = _PERIOD_RE.findall(report_nm)
+        if not hits:
+            return None
+        # One scan finds every keyword; the earliest-listed keyword wins as before.
+        # Only the short matched fragments need case-folding.
+        best = min((hit.casefold() for hit in hits), key=_PERIOD_PRIORITY.__getitem__)
+        return _PERIOD_KEYWORDS[best]
 
     # ------------------------------------------------------------------
     # Utilities
@@ -559,36 +1017,20 @@ class OpenDartClient:
         if isinstance(value, str) and value:
             return value
         if isinstance(value, _dt.date):
-            return value.strftime("%Y-%m-%d")
+            return _fmt_date(value)
 
-        today = _dt.date.today()
-        if default_today:
-            return today.strftime("%Y-%m-%d")
-        if days_back is not None:
-            start_date = today - _dt.timedelta(days=days_back)
-            return start_date.strftime("%Y-%m-%d")
-        return today.strftime("%Y-%m-%d")
+        today = self._get_today()
+        if not default_today and days_back is not None:
+            return _fmt_date(today - _dt.timedelta(days=days_back))
+        return _fmt_date(today)
 
     def _resolve_report_code(self, period: str) -> str:
-        period_key = (period or "annual").lower()
-        mapping = {
-            "annual": "11011",
-            "business": "11011",
-            "q4": "11011",
-            "half": "11012",
-            "semiannual": "11012",
-            "q2": "11012",
-            "q1": "11013",
-            "first": "11013",
-            "q3": "11014",
-            "third": "11014",
-        }
-        code = mapping.get(period_key)
-        if not code:
+        try:
+            return _REPORT_CODE_MAP[(period or "annual").lower()]
+        except KeyError:
             raise OpenDartError(
-                f"Unsupported period '{period}'. Expected one of: {sorted(set(mapping.keys()))}"
-            )
-        return code
+                f"Unsupported period '{period}'. Expected one of: {list(_REPORT_CODE_KEYS)}"
+            ) from None
 
     def _parse_amount(self, value: Any) -> Optional[float]:
         if value is None:
@@ -596,10 +1038,9 @@ class OpenDartClient:
         if isinstance(value, (int, float)):
             return float(value)
         text = str(value).strip()
-        if not text or text in {"-", "NaN", "nan"}:
+        if text in _BLANK_AMOUNTS:
             return None
-        text = text.replace(",", "")
         try:
-            return float(text)
+            return float(text.translate(_COMMA_STRIP))
         except ValueError:
             return None
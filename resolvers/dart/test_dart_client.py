@@ -12,9 +12,16 @@ reference company. Set ``DART_API_KEY`` in your environment before running.
 from __future__ import annotations
 
 import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
-from config import DART_API_KEY
-from dart_client import OpenDartClient, OpenDartError
+# Import through the repo-root package so this ``config`` never shadows the
+# SEC one when both smoke tests load in one process (e.g. under pytest)
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from resolvers.dart.config import DART_API_KEY
+from resolvers.dart.dart_client import OpenDartClient, OpenDartError, create_session
 
 
 def main() -> None:
@@ -70,21 +77,28 @@ def main() -> None:
         "005930", # 삼성전자 (KOSPI : 005930)
         "138040", # 메리츠금융지주 (KOSPI : 138040)
     ]
-    for company in companies:
-        client = OpenDartClient(corp_code=company)
+    session = create_session()
+    account_names = [
+        "매출액",
+        "매출총액",
+        "영업수익",
+        "Revenue",
+    ]
+
+    def fetch_one(corp_code: str):
+        client = OpenDartClient(corp_code=corp_code, session=session)
 
         # filings = client.list_filings(kind="A", limit=5)
         # for filing in filings:
         #     print(f"  {filing.get('report_nm')} — {filing.get('rcept_dt')} ({filing.get('rcept_no')})")
 
-        company = client.get_company()
-        metric = client.get_latest_metric([
-            "매출액",
-            "매출총액",
-            "영업수익",
-            "Revenue",
-        ])
+        return client.get_company(), client.get_latest_metric(account_names)
+
+    # Companies are fetched concurrently; results print in list order
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(fetch_one, companies))
 
+    for company, metric in results:
         print(f"Company: {company.get('corp_name')} ({company.get('corp_code')})")
         print(json.dumps(metric, ensure_ascii=False, indent=2))
 
@@ -1,5 +1,7 @@
 import os
+import sys
 from dotenv import load_dotenv
+from urllib3.util.request import ACCEPT_ENCODING
 
 load_dotenv()
 
@@ -7,23 +9,43 @@ load_dotenv()
 SEC_USER_AGENT = os.getenv("SEC_USER_AGENT", "RevenueBetPrototype contact@example.com")
 SEC_HEADERS = {
     "User-Agent": SEC_USER_AGENT,
-    "Accept-Encoding": "gzip, deflate"
+    # urllib3's list adds "br" (and "zstd") only when a decoder is installed
+    "Accept-Encoding": ACCEPT_ENCODING,
 }
 
 # Polling Configuration (can be overridden by CLI)
 POLL_INTERVAL_SEC = int(os.getenv("POLL_INTERVAL_SEC", "600"))
 
+# Upper bound for the adaptive interval while no new filings appear
+MAX_POLL_INTERVAL_SEC = int(os.getenv("MAX_POLL_INTERVAL_SEC", "3600"))
+
+# Concurrent SEC checks (and pooled connections) when monitoring several CIKs
+SEC_MAX_CONCURRENCY = int(os.getenv("SEC_MAX_CONCURRENCY", "4"))
+
+# Append-only JSONL file that receives one line per resolution
+RESOLUTION_LOG = os.getenv("RESOLUTION_LOG", "resolutions.jsonl")
+
+# Directory for the on-disk conditional-GET cache (ETag/Last-Modified plus
+# body), so restarts revalidate instead of re-downloading. Empty disables it.
+SEC_CACHE_DIR = os.path.expanduser(os.getenv("SEC_CACHE_DIR", ""))
+
+# Serve cached responses without any request while younger than this many
+# seconds (handy when iterating locally). 0 always revalidates with SEC.
+SEC_CACHE_TTL_SEC = int(os.getenv("SEC_CACHE_TTL_SEC", "0"))
+
 # Target form types
 TARGET_FORMS = ["10-Q", "10-K"]
 
-# Helpful defaults for common metrics (can be overridden by CLI input)
-DEFAULT_REVENUE_TAGS = [
+# Helpful defaults for common metrics (can be overridden by CLI input).
+# Tuples keep them hashable for cache keys; interning makes the us-gaap
+# dict lookups in get_latest_metric identity comparisons.
+DEFAULT_REVENUE_TAGS = tuple(sys.intern(t) for t in (
     "RevenueFromContractWithCustomerExcludingAssessedTax",
     "SalesRevenueNet",
-    "Revenues"
-]
+    "Revenues",
+))
 
-DEFAULT_NET_INCOME_TAGS = [
+DEFAULT_NET_INCOME_TAGS = tuple(sys.intern(t) for t in (
     "NetIncomeLoss",
-    "ProfitLoss"
-]
+    "ProfitLoss",
+))
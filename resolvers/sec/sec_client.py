@@ -1,46 +1,295 @@
 """SEC API client for fetching submissions and company facts."""
 
+import asyncio
+import hashlib
+import json
+import os
 import requests
 import time
-from typing import Optional, Dict, Any, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Sequence
 
 try:
-    from .config import SEC_HEADERS  # type: ignore[attr-defined]
-except ImportError:
-    from config import SEC_HEADERS  # type: ignore
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - falls back to response.json()
+    orjson = None  # type: ignore
+
+try:
+    from .config import SEC_CACHE_DIR, SEC_CACHE_TTL_SEC, SEC_HEADERS  # type: ignore[attr-defined]
+    from .._http import build_session
+    from .._ratelimit import TokenBucket
+except ImportError:  # script execution; the repo root must be on sys.path
+    from config import SEC_CACHE_DIR, SEC_CACHE_TTL_SEC, SEC_HEADERS  # type: ignore
+    from resolvers._http import build_session
+    from resolvers._ratelimit import TokenBucket
+
+
+# SEC fair-access limit is 10 requests/second per host, so every SECClient
+# in the process draws from one bucket; capacity 1 keeps calls evenly spaced
+_SEC_BUCKET = TokenBucket(1, 10.0)
+
+
+def _loads(raw: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _disk_cache_path(url: str) -> Optional[str]:
+    if not SEC_CACHE_DIR:
+        return None
+    return os.path.join(SEC_CACHE_DIR, hashlib.sha1(url.encode()).hexdigest() + ".json")
+
+
+def _load_disk_entry(url: str) -> Optional[tuple]:
+    """Return (validators, data, fetched_at) persisted for ``url``, or None.
+    
+    ``fetched_at`` is the file's mtime, bumped whenever SEC confirms the
+    copy is still current.
+    """
+    path = _disk_cache_path(url)
+    if not path or not os.path.exists(path):
+        return None
+    try:
+        with open(path, "rb") as handle:
+            raw = handle.read()
+        entry = _loads(raw)
+        return entry["validators"], entry["data"], os.path.getmtime(path)
+    except (OSError, ValueError, KeyError, TypeError):
+        return None  # a damaged entry only costs a full download
+
+
+def _touch_disk_entry(url: str) -> None:
+    path = _disk_cache_path(url)
+    if path:
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+
+def _store_disk_entry(url: str, validators: Dict[str, str], data: Dict[str, Any]) -> None:
+    path = _disk_cache_path(url)
+    if not path:
+        return
+    entry = {"url": url, "validators": validators, "data": data}
+    try:
+        os.makedirs(SEC_CACHE_DIR, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as handle:
+            if orjson is not None:
+                handle.write(orjson.dumps(entry))
+            else:
+                handle.write(json.dumps(entry, separators=(",", ":")).encode())
+        os.replace(tmp_path, path)
+    except (OSError, TypeError, ValueError):
+        pass  # persistence is best-effort
+
+
+class FilingsView(Sequence):
+    """Read-only sequence of recent filings over SEC's columnar arrays.
+    
+    Keeps the ``form``/``accessionNumber``/``filingDate`` columns as returned
+    and only the positions of matching rows; each filing dict is built when
+    it is accessed, so callers that read ``filings[0]`` pay for one row.
+    """
+    
+    __slots__ = ("_forms", "_accessions", "_dates", "_rows")
+    
+    def __init__(self, forms: List[str], accessions: List[str], dates: List[str], rows: List[int]):
+        self._forms = forms
+        self._accessions = accessions
+        self._dates = dates
+        self._rows = rows
+    
+    def __len__(self) -> int:
+        return len(self._rows)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._filing(i) for i in self._rows[index]]
+        return self._filing(self._rows[index])
+    
+    def _filing(self, i: int) -> Dict[str, Any]:
+        return {"form": self._forms[i], "accession": self._accessions[i], "filing_date": self._dates[i]}
+    
+    def __repr__(self) -> str:
+        return f"FilingsView({list(self)!r})"
+
+
+class FactsIndex:
+    """Per-tag view of a companyfacts payload for repeated metric lookups.
+    
+    ``rows(tag)`` returns the tag's USD facts that carry ``val``/``end``/``accn``,
+    newest first (by period end, then filing date). Tags are indexed on first
+    lookup and memoized, so only the tags actually queried are sorted.
+    """
+    
+    __slots__ = ("_us_gaap", "_rows")
+    
+    def __init__(self, us_gaap: Dict[str, Any]):
+        self._us_gaap = us_gaap
+        self._rows: Dict[str, List[Dict[str, Any]]] = {}
+    
+    def rows(self, tag: str) -> List[Dict[str, Any]]:
+        """Usable USD facts for ``tag``, newest first (empty if none)."""
+        rows = self._rows.get(tag)
+        if rows is None:
+            usd_facts = self._us_gaap.get(tag, {}).get("units", {}).get("USD", [])
+            rows = [f for f in usd_facts if "val" in f and "end" in f and "accn" in f]
+            # Stable descending sort keeps the earliest of equal facts first, as max() did
+            rows.sort(key=lambda x: (x["end"], x.get("filed", "")), reverse=True)
+            self._rows[tag] = rows
+        return rows
+    
+    def latest(self, tag: str) -> Optional[Dict[str, Any]]:
+        """Newest usable USD fact for ``tag``, or None."""
+        rows = self.rows(tag)
+        return rows[0] if rows else None
+
+
+def create_session(pool_size: int = 4) -> requests.Session:
+    """Build a keep-alive session for data.sec.gov with SEC headers and retries.
+    
+    Args:
+        pool_size: Number of pooled connections kept warm per host
+        
+    Returns:
+        Session that can be shared between SECClient instances
+    """
+    return build_session(pool_size, pool_size, SEC_HEADERS)
+
+
+# Endpoint templates, bound once so each client only formats its CIK in
+_SUBMISSIONS_URL = "https://data.sec.gov/submissions/CIK{cik}.json".format
+_COMPANYFACTS_URL = "https://data.sec.gov/api/xbrl/companyfacts/CIK{cik}.json".format
 
 
 class SECClient:
     """Client for interacting with SEC EDGAR APIs."""
     
-    def __init__(self, cik: str):
-        self.session = requests.Session()
-        self.session.headers.update(SEC_HEADERS)
-        self._last_request_time = 0
-        self._min_request_interval = 0.1  # 10 req/sec max
+    # Many short-lived clients are created for multi-CIK runs; no per-instance dict
+    __slots__ = (
+        "session",
+        "_owns_session",
+        "raise_errors",
+        "use_cache",
+        "_conditional_cache",
+        "cik",
+        "submissions_url",
+        "companyfacts_url",
+    )
+    
+    def __init__(
+        self,
+        cik: str,
+        session: Optional[requests.Session] = None,
+        raise_errors: bool = False,
+        use_cache: bool = True,
+    ):
+        self.session = session if session is not None else create_session()
+        # Only a session we created is ours to close; shared ones belong to the caller
+        self._owns_session = session is None
+        # When set, request failures propagate instead of returning None so
+        # long-running callers can back off by error type.
+        self.raise_errors = raise_errors
+        # Disable to ignore the on-disk cache and SEC_CACHE_TTL_SEC (e.g. in CI)
+        self.use_cache = use_cache
+        # url -> (validator headers, parsed JSON, time.time() of last 200/304)
+        self._conditional_cache: Dict[str, tuple[Dict[str, str], Dict[str, Any], float]] = {}
         self.cik = cik
-        self.submissions_url = f"https://data.sec.gov/submissions/CIK{self.cik}.json"
-        self.companyfacts_url = f"https://data.sec.gov/api/xbrl/companyfacts/CIK{self.cik}.json"
+        self.submissions_url = _SUBMISSIONS_URL(cik=cik)
+        self.companyfacts_url = _COMPANYFACTS_URL(cik=cik)
+    
+    def close(self):
+        """Release pooled connections if this client created its own session."""
+        if self._owns_session:
+            self.session.close()
+    
+    def __enter__(self) -> "SECClient":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
     
     def _rate_limit(self):
-        """Ensure we don't exceed SEC rate limits (10 req/sec)."""
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self._min_request_interval:
-            time.sleep(self._min_request_interval - elapsed)
-        self._last_request_time = time.time()
+        """Ensure we don't exceed SEC rate limits (10 req/sec across all clients)."""
+        _SEC_BUCKET.acquire()
+    
+    def _get_json(self, url: str) -> Dict[str, Any]:
+        """GET a JSON endpoint, revalidating any cached copy with ETag/Last-Modified.
+        
+        A 304 response reuses the previously parsed body, so unchanged
+        payloads cost one round-trip and no download or parsing. When
+        SEC_CACHE_DIR is set, entries are also persisted there so a restarted
+        process can revalidate instead of re-downloading, and with
+        SEC_CACHE_TTL_SEC a fresh enough copy is returned with no request.
+        
+        Raises:
+            requests.RequestException: if the request fails
+        """
+        cached = self._conditional_cache.get(url)
+        if cached is None and self.use_cache:
+            # Fall back to a copy persisted by an earlier process
+            cached = _load_disk_entry(url)
+            if cached is not None:
+                self._conditional_cache[url] = cached
+        if (
+            cached
+            and self.use_cache
+            and SEC_CACHE_TTL_SEC > 0
+            and time.time() - cached[2] < SEC_CACHE_TTL_SEC
+        ):
+            return cached[1]
+        
+        self._rate_limit()
+        headers: Dict[str, str] = {}
+        if cached:
+            validators = cached[0]
+            if "ETag" in validators:
+                headers["If-None-Match"] = validators["ETag"]
+            if "Last-Modified" in validators:
+                headers["If-Modified-Since"] = validators["Last-Modified"]
+        
+        response = self.session.get(url, headers=headers, timeout=10)
+        if response.status_code == 304 and cached:
+            self._conditional_cache[url] = (cached[0], cached[1], time.time())
+            if self.use_cache:
+                _touch_disk_entry(url)
+            return cached[1]
+        response.raise_for_status()
+        # companyfacts bodies run to megabytes; orjson decodes them several times faster
+        try:
+            data = _loads(response.content)
+        except ValueError as e:  # orjson and json decode errors are ValueErrors
+            raise requests.exceptions.InvalidJSONError(str(e), response=response) from e
+        
+        validators = {
+            key: response.headers[key]
+            for key in ("ETag", "Last-Modified")
+            if key in response.headers
+        }
+        if validators or (self.use_cache and SEC_CACHE_TTL_SEC > 0):
+            self._conditional_cache[url] = (validators, data, time.time())
+            if self.use_cache:
+                _store_disk_entry(url, validators, data)
+        return data
     
     def get_submissions(self) -> Optional[Dict[str, Any]]:
         """Fetch company submissions data.
         
         Returns:
             Dict containing recent filings, or None if request fails
+            
+        Raises:
+            requests.RequestException: if the request fails and ``raise_errors`` is set
         """
-        self._rate_limit()
         try:
-            response = self.session.get(self.submissions_url, timeout=10)
-            response.raise_for_status()
-            return response.json()
+            return self._get_json(self.submissions_url)
         except requests.RequestException as e:
+            if self.raise_errors:
+                raise
             print(f"Error fetching submissions: {e}")
             return None
     
@@ -49,25 +298,76 @@ class SECClient:
         
         Returns:
             Dict containing company facts, or None if request fails
+            
+        Raises:
+            requests.RequestException: if the request fails and ``raise_errors`` is set
         """
-        self._rate_limit()
         try:
-            response = self.session.get(self.companyfacts_url, timeout=10)
-            response.raise_for_status()
-            return response.json()
+            return self._get_json(self.companyfacts_url)
         except requests.RequestException as e:
+            if self.raise_errors:
+                raise
             print(f"Error fetching company facts: {e}")
             return None
     
+    async def aget_submissions(self) -> Optional[Dict[str, Any]]:
+        """Async variant of ``get_submissions`` (runs in a worker thread)."""
+        return await asyncio.to_thread(self.get_submissions)
+    
+    async def aget_company_facts(self) -> Optional[Dict[str, Any]]:
+        """Async variant of ``get_company_facts`` (runs in a worker thread)."""
+        return await asyncio.to_thread(self.get_company_facts)
+    
+    def batch_get_facts(self, ciks: List[str], max_workers: int = 4) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Fetch company facts for several CIKs concurrently over this client's session.
+        
+        Requests still draw from the shared SEC rate-limit bucket, so this
+        overlaps round-trips without exceeding 10 req/sec.
+        
+        Args:
+            ciks: 10-digit zero-padded CIKs
+            max_workers: Maximum requests in flight at once
+            
+        Returns:
+            Mapping of CIK to its company facts (None if that request failed)
+        """
+        if not ciks:
+            return {}
+        clients = [
+            SECClient(cik, session=self.session, raise_errors=self.raise_errors, use_cache=self.use_cache)
+            for cik in ciks
+        ]
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(clients)))) as executor:
+            results = list(executor.map(SECClient.get_company_facts, clients))
+        return dict(zip(ciks, results))
+    
+    def build_facts_index(self, facts: Optional[Dict[str, Any]]) -> FactsIndex:
+        """Index company facts once so several metric lookups reuse the work.
+        
+        Args:
+            facts: Company facts JSON from SEC API
+            
+        Returns:
+            FactsIndex to pass to ``get_latest_metric`` in place of ``facts``
+        """
+        return FactsIndex((facts or {}).get("facts", {}).get("us-gaap", {}))
+    
     def get_latest_metric(self, facts: Dict[str, Any], tags: List[str]) -> Optional[Dict[str, Any]]:
         """Extract the most recent desired metric from company facts, trying tags in order.
         
         Args:
-            facts: Company facts JSON from SEC API
+            facts: Company facts JSON from SEC API, or a FactsIndex built from it
             
         Returns:
             Dict with tag, value, end date, and accession number, or None if not found
         """
+        if isinstance(facts, FactsIndex):
+            for tag in tags:
+                fact = facts.latest(tag)
+                if fact is not None:
+                    return self._metric_from_fact(tag, fact)
+            return None
+        
         if not facts or "facts" not in facts:
             return None
         
@@ -79,39 +379,51 @@ class SECClient:
             usd_facts = node.get("units", {}).get("USD", [])
             
             if usd_facts:
-                # Sort by end date (most recent first)
-                # Filter out facts without required fields
-                valid_facts = [
-                    f for f in usd_facts 
-                    if all(k in f for k in ["val", "end", "accn"])
-                ]
+                # Single pass over facts that carry the required fields;
+                # later filings win ties on the same period end
+                latest = max(
+                    (f for f in usd_facts if "val" in f and "end" in f and "accn" in f),
+                    key=lambda x: (x["end"], x.get("filed", "")),
+                    default=None,
+                )
                 
-                if valid_facts:
-                    latest = sorted(valid_facts, key=lambda x: x["end"], reverse=True)[0]
-                    return {
-                        "tag": tag,
-                        "value": latest["val"],
-                        "end": latest["end"],
-                        "currency": "usd",
-                        "accession": latest["accn"],
-                        "form": latest.get("form", ""),
-                        "filed": latest.get("filed", ""),
-                        "fiscal_year": latest.get("fy", ""),
-                        "fiscal_period": latest.get("fp", "")
-                    }
+                if latest is not None:
+                    return self._metric_from_fact(tag, latest)
         
         return None
     
-    def get_recent_filings(self, forms: List[str]) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _metric_from_fact(tag: str, fact: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "tag": tag,
+            "value": fact["val"],
+            "end": fact["end"],
+            "currency": "usd",
+            "accession": fact["accn"],
+            "form": fact.get("form", ""),
+            "filed": fact.get("filed", ""),
+            "fiscal_year": fact.get("fy", ""),
+            "fiscal_period": fact.get("fp", "")
+        }
+    
+    def get_recent_filings(self, forms: List[str]) -> Sequence[Dict[str, Any]]:
         """Get recent filings of specified form types.
         
         Args:
             forms: List of form types to filter (e.g., ['10-Q', '10-K'])
             
         Returns:
-            List of dicts with form type, accession number, and filing date
+            Sequence of dicts with form type, accession number, and filing date
+            (a FilingsView; rows are materialized on access)
+        """
+        return self.filter_recent_filings(self.get_submissions(), forms)
+    
+    @staticmethod
+    def filter_recent_filings(submissions: Optional[Dict[str, Any]], forms: List[str]) -> Sequence[Dict[str, Any]]:
+        """Select recent filings of the given form types from fetched submissions.
+        
+        Lets callers that already hold the submissions JSON skip a second fetch.
         """
-        submissions = self.get_submissions()
         if not submissions:
             return []
         
@@ -123,13 +435,8 @@ class SECClient:
         accn_list = recent.get("accessionNumber", [])
         date_list = recent.get("filingDate", [])
         
-        filings = []
-        for form, accn, date in zip(form_list, accn_list, date_list):
-            if form in forms:
-                filings.append({
-                    "form": form,
-                    "accession": accn,
-                    "filing_date": date
-                })
-        
-        return filings
+        # Only the form column is scanned; hashed membership per row
+        wanted = frozenset(forms)
+        count = min(len(form_list), len(accn_list), len(date_list))
+        rows = [i for i, form in zip(range(count), form_list) if form in wanted]
+        return FilingsView(form_list, accn_list, date_list, rows)
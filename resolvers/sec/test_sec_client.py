@@ -1,70 +1,158 @@
 #!/usr/bin/env python3
-"""Quick test script to verify SEC API client works."""
+"""Quick test script to verify SEC API client works.
 
-from sec_client import SECClient
+Run for one or more CIKs (checked concurrently, within SEC's rate limit):
+
+    python resolvers/sec/test_sec_client.py 0000320193 0000789019
+
+Or collect it with pytest (add ``-n auto`` with pytest-xdist to spread CIKs):
+
+    pytest resolvers/sec/test_sec_client.py
+"""
+
+import argparse
+import asyncio
 import json
+import sys
+from pathlib import Path
+
+# Import through the repo-root package so pytest can collect this next to the
+# DART smoke test without the two ``config`` modules shadowing each other
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from resolvers.sec.config import DEFAULT_REVENUE_TAGS
+from resolvers.sec.sec_client import SECClient, create_session
+
+try:  # pytest is only needed to collect the test (dev extra), not for the CLI
+    import pytest  # type: ignore
+except ImportError:  # pragma: no cover - script use without the dev extra
+    pytest = None  # type: ignore
+
+DEFAULT_CIKS = ["0000320193"]
+
+# Apple, Microsoft, Amazon
+PYTEST_CIKS = ["0000320193", "0000789019", "0001018724"]
+
+# CIKs checked at once; the shared token bucket still caps SEC at 10 req/sec
+CONCURRENCY_LIMIT = 4
+
+
+def _parametrize_ciks(test):
+    """Run ``test`` once per PYTEST_CIKS entry when pytest is available."""
+    return pytest.mark.parametrize("cik", PYTEST_CIKS)(test) if pytest is not None else test
 
 
-def test_client():
+@_parametrize_ciks
+def test_sec_client(cik):
     """Test SEC client basic functionality."""
-    print("="*60)
-    print("Testing SEC Client")
-    print("="*60)
+    assert asyncio.run(run_checks([cik]))
+
+
+async def run_checks(ciks, concurrency: int = CONCURRENCY_LIMIT) -> bool:
+    """Check every CIK concurrently and print a summary; True if all passed."""
+    session = create_session(pool_size=concurrency)
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def check_one(cik: str) -> bool:
+        async with semaphore:
+            return await check_client(SECClient(cik, session=session))
     
-    client = SECClient("0000320193")
+    try:
+        results = await asyncio.gather(*(check_one(cik) for cik in ciks))
+    finally:
+        session.close()
     
+    if len(ciks) > 1:
+        summary = ["", "Summary", "-" * 60]
+        summary.extend(f"   {cik}  {'✅' if ok else '❌'}" for cik, ok in zip(ciks, results))
+        sys.stdout.write("\n".join(summary) + "\n")
+    return all(results)
+
+
+async def check_client(client: SECClient) -> bool:
+    # Output is collected and written once at the end
+    out = ["=" * 60, f"Testing SEC Client (CIK {client.cik})", "=" * 60]
+    try:
+        return _collect_report(out, client, *await _fetch(out, client))
+    finally:
+        sys.stdout.write("\n".join(out) + "\n")
+
+
+async def _fetch(out: list, client: SECClient):
+    # Submissions and company facts are independent, so fetch them together
+    out.append("\nFetching submissions and company facts...")
+    return await asyncio.gather(
+        client.aget_submissions(),
+        client.aget_company_facts(),
+    )
+
+
+def _collect_report(out: list, client: SECClient, submissions, facts) -> bool:
     # Test 1: Fetch submissions
-    print("\n1. Fetching submissions...")
-    submissions = client.get_submissions()
+    out.append("\n1. Submissions")
     if submissions:
-        print(f"✅ Success! Entity: {submissions.get('name', 'Unknown')}")
         recent = submissions.get("filings", {}).get("recent", {})
         forms = recent.get("form", [])[:5]
-        print(f"   Recent forms: {forms}")
+        out.append(f"✅ Success! Entity: {submissions.get('name', 'Unknown')}")
+        out.append(f"   Recent forms: {forms}")
     else:
-        print("❌ Failed to fetch submissions")
-        return
+        out.append("❌ Failed to fetch submissions")
+        return False
     
     # Test 2: Fetch company facts
-    print("\n2. Fetching company facts...")
-    facts = client.get_company_facts()
-    if facts:
-        print(f"✅ Success! Entity: {facts.get('entityName', 'Unknown')}")
-        print(f"   CIK: {facts.get('cik', 'Unknown')}")
+    out.append("\n2. Company facts")
+    if facts and facts.get("cik"):
+        out.append(f"✅ Success! Entity: {facts.get('entityName', 'Unknown')}")
+        out.append(f"   CIK: {facts.get('cik', 'Unknown')}")
     else:
-        print("❌ Failed to fetch company facts")
-        return
+        out.append("❌ Failed to fetch company facts")
+        return False
     
     # Test 3: Extract revenue
-    print("\n3. Extracting latest revenue...")
-    revenue = client.get_latest_metric(facts, ["Revenues"])
-    if revenue:
-        print(f"✅ Success!")
-        print(f"   Tag:          {revenue['tag']}")
-        print(f"   Value:        ${revenue['value']:,.0f}")
-        print(f"   Period End:   {revenue['end']}")
-        print(f"   Form:         {revenue['form']}")
-        print(f"   Filed:        {revenue['filed']}")
-        print(f"   Fiscal:       {revenue['fiscal_period']} {revenue['fiscal_year']}")
+    out.append("\n3. Extracting latest revenue...")
+    # Index once; further metric lookups on these facts reuse it
+    facts_index = client.build_facts_index(facts)
+    revenue = client.get_latest_metric(facts_index, DEFAULT_REVENUE_TAGS)
+    if revenue and revenue["value"] > 0:
+        out.extend([
+            "✅ Success!",
+            f"   Tag:          {revenue['tag']}",
+            f"   Value:        ${revenue['value']:,.0f}",
+            f"   Period End:   {revenue['end']}",
+            f"   Form:         {revenue['form']}",
+            f"   Filed:        {revenue['filed']}",
+            f"   Fiscal:       {revenue['fiscal_period']} {revenue['fiscal_year']}",
+        ])
     else:
-        print("❌ Failed to extract revenue")
-        return
+        out.append("❌ Failed to extract a positive revenue")
+        return False
     
     # Test 4: Get recent filings
-    print("\n4. Getting recent 10-Q/10-K filings...")
-    filings = client.get_recent_filings(["10-Q", "10-K"])
+    out.append("\n4. Getting recent 10-Q/10-K filings...")
+    # Built from the submissions already fetched; no blocking request on the loop
+    filings = client.filter_recent_filings(submissions, ["10-Q", "10-K"])
     if filings:
-        print(f"✅ Found {len(filings)} recent filings")
-        for i, filing in enumerate(filings[:3], 1):
-            print(f"   {i}. {filing['form']} - {filing['filing_date']} - {filing['accession']}")
+        out.append(f"✅ Found {len(filings)} recent filings")
+        out.extend(
+            f"   {i}. {filing['form']} - {filing['filing_date']} - {filing['accession']}"
+            for i, filing in enumerate(filings[:3], 1)
+        )
     else:
-        print("❌ No filings found")
+        out.append("❌ No filings found")
+        return False
     
-    print("\n" + "="*60)
-    print("All tests passed! ✅")
-    print("="*60)
+    out.extend(["\n" + "=" * 60, "All tests passed! ✅", "=" * 60])
+    return True
 
 
-if __name__ == "__main__":
-    test_client()
+def main():
+    parser = argparse.ArgumentParser(description="Smoke-test the SEC client against live data.sec.gov")
+    parser.add_argument("ciks", nargs="*", default=DEFAULT_CIKS, help="10-digit CIKs (default: Apple)")
+    parser.add_argument("--concurrency", type=int, default=CONCURRENCY_LIMIT, help="CIKs checked at once")
+    args = parser.parse_args()
+    ok = asyncio.run(run_checks(args.ciks, concurrency=max(1, args.concurrency)))
+    sys.exit(0 if ok else 1)
+
 
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""Offline tests for the monitor's polling, backoff and config helpers.
+
+Run with:
+
+    pytest test_monitor.py
+"""
+
+import json
+
+import pytest
+import requests
+
+import monitor
+from monitor import (
+    POLL_INTERVAL_SEC,
+    PRESETS,
+    error_backoff,
+    load_markets_file,
+    next_poll_interval,
+    normalize_cik,
+)
+
+
+def _http_error(status: int, headers=None) -> requests.HTTPError:
+    response = requests.Response()
+    response.status_code = status
+    response.headers.update(headers or {})
+    return requests.HTTPError(response=response)
+
+
+@pytest.fixture
+def no_jitter(monkeypatch):
+    monkeypatch.setattr(monitor.random, "uniform", lambda low, high: 1.0)
+
+
+def test_next_poll_interval_doubles_per_miss(no_jitter):
+    big = POLL_INTERVAL_SEC * 1000
+    assert next_poll_interval(0, big) == POLL_INTERVAL_SEC
+    assert next_poll_interval(1, big) == POLL_INTERVAL_SEC * 2
+    assert next_poll_interval(3, big) == POLL_INTERVAL_SEC * 8
+    # The exponent stops growing after six misses
+    assert next_poll_interval(50, big) == POLL_INTERVAL_SEC * 64
+
+
+def test_next_poll_interval_caps_at_max(no_jitter):
+    assert next_poll_interval(10, POLL_INTERVAL_SEC * 3) == POLL_INTERVAL_SEC * 3
+    # A cap below the base interval never shortens the poll
+    assert next_poll_interval(10, 1) == POLL_INTERVAL_SEC
+
+
+def test_next_poll_interval_jitter_stays_within_ten_percent():
+    for _ in range(100):
+        interval = next_poll_interval(0, POLL_INTERVAL_SEC)
+        assert POLL_INTERVAL_SEC * 0.9 <= interval <= POLL_INTERVAL_SEC * 1.1
+
+
+def test_error_backoff_honours_retry_after():
+    assert error_backoff(_http_error(429, {"Retry-After": "17"}), 0, 60) == 17.0
+
+
+def test_error_backoff_429_without_usable_retry_after():
+    assert error_backoff(_http_error(429), 0, 60) == POLL_INTERVAL_SEC * 4
+    # HTTP-date form is not parsed; fall back to the default
+    date = {"Retry-After": "Wed, 21 Oct 2026 07:28:00 GMT"}
+    assert error_backoff(_http_error(429, date), 0, 60) == POLL_INTERVAL_SEC * 4
+
+
+def test_error_backoff_exponential_and_capped():
+    big = POLL_INTERVAL_SEC * 1000
+    assert error_backoff(_http_error(503), 0, big) == POLL_INTERVAL_SEC
+    assert error_backoff(_http_error(503), 2, big) == POLL_INTERVAL_SEC * 4
+    assert error_backoff(requests.ConnectionError(), 3, big) == POLL_INTERVAL_SEC * 8
+    assert error_backoff(_http_error(503), 20, POLL_INTERVAL_SEC * 5) == POLL_INTERVAL_SEC * 5
+
+
+def _write_markets(tmp_path, entries) -> str:
+    path = tmp_path / "markets.json"
+    path.write_text(json.dumps(entries), encoding="utf-8")
+    return str(path)
+
+
+def test_load_markets_file_tags_and_preset(tmp_path):
+    path = _write_markets(tmp_path, [
+        {"cik": "0000320193", "estimate": "125000000000", "tags": ["Revenues"]},
+        {"cik": 789019, "estimate": 5, "preset": "netincome"},
+    ])
+    first, second = load_markets_file(path)
+    assert first == {"cik": "0000320193", "estimate": 125e9, "tags": ("Revenues",)}
+    assert second["cik"] == "0000789019"
+    assert second["tags"] == tuple(PRESETS["netincome"])
+
+
+@pytest.mark.parametrize("entries", [
+    {"cik": "0000320193"},
+    ["0000320193"],
+    [{"cik": "0000320193", "estimate": 1}],
+    [{"cik": "0000320193", "estimate": 1, "tags": "Revenues"}],
+    [{"cik": "0000320193", "estimate": 1, "tags": ["Revenues", 3]}],
+    [{"cik": "0000320193", "estimate": 1, "preset": ["revenue"]}],
+    [{"cik": "0000320193", "estimate": 1, "preset": "unknown"}],
+    [{"cik": "0000320193", "estimate": None, "tags": ["Revenues"]}],
+    [{"cik": "0000320193", "estimate": "lots", "tags": ["Revenues"]}],
+    [{"cik": "AAPL", "estimate": 1, "tags": ["Revenues"]}],
+])
+def test_load_markets_file_rejects_invalid_entries(tmp_path, entries):
+    with pytest.raises(ValueError):
+        load_markets_file(_write_markets(tmp_path, entries))
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("0000320193", "0000320193"),
+    (" 320193 ", "0000320193"),
+    (320193, "0000320193"),
+])
+def test_normalize_cik(value, expected):
+    assert normalize_cik(value) == expected
+
+
+@pytest.mark.parametrize("value", ["", "12345678901", "CIK320193", True, 3.5, None])
+def test_normalize_cik_rejects(value):
+    with pytest.raises(ValueError):
+        normalize_cik(value)